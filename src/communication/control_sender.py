@@ -1,11 +1,28 @@
 import asyncio
 import json
 import logging
+import socket
 from typing import Callable, Awaitable
 
-from interfaces.communication import IControlNodeSender
+from interfaces.communication import IControlNodeSender, ControlNodeConnectionError
 from domain.models import ControlPacket
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+_NL = b"\n"  # 패킷 구분자
+_ACK = b"ACK"
+_ACK_LINE = _ACK + _NL
+SOCKET_BUFFER_SIZE = 1 << 22  # 송수신 소켓 버퍼 크기 (4MB)
+
 
 class ControlSender(IControlNodeSender):
     """컨트롤 노드 통신 구현체 (c)"""
@@ -24,29 +41,56 @@ class ControlSender(IControlNodeSender):
 
     async def connect(self) -> None:
         """컨트롤 노드 연결"""
+        # 재연결 시 이전 연결과 수신 태스크 정리
+        if self._writer is not None:
+            await self.disconnect()
+
         self._reader, self._writer = await asyncio.open_connection(
             self._address, self._port
         )
+        self._configure_socket()
+
+    def _configure_socket(self) -> None:
+        """저지연 송수신을 위한 소켓 옵션 설정 (Nagle 비활성화, 버퍼 확장)"""
+        sock = self._writer.get_extra_info("socket")
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        except OSError as e:
+            self._logger.warning("Failed to configure socket options: %s", e)
 
     async def disconnect(self) -> None:
         """연결 해제"""
         await self.stop_listening()
         if self._writer:
-            self._writer.close()
-            await self._writer.wait_closed()
+            writer = self._writer
+            self._reader = None
+            self._writer = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass  # 이미 끊긴 연결
 
     async def send_packet(self, packet: ControlPacket) -> bool:
         """통합 패킷 전송 (자세, 압력, 지속시간, controls 포함)"""
         if not self._writer:
-            raise ConnectionError("Not connected to control node")
+            raise ControlNodeConnectionError("Not connected to control node")
 
         # ACK 이벤트 초기화
         self._ack_event.clear()
         self._ack_received = False
 
-        message = json.dumps(packet.to_dict()).encode() + b"\n"
-        self._writer.write(message)
-        await self._writer.drain()
+        message = _dumps(packet.to_dict())
+        try:
+            self._writer.writelines((message, _NL))
+            await self._writer.drain()
+        except OSError as e:
+            raise ControlNodeConnectionError(f"Failed to send packet to control node: {e}") from e
 
         # _listen_loop에서 ACK를 수신할 때까지 대기
         try:
@@ -87,6 +131,11 @@ class ControlSender(IControlNodeSender):
 
     async def _listen_loop(self) -> None:
         """센서 데이터 및 ACK 수신 루프 (단일 reader로 모든 수신 처리)"""
+        # 루프 내 반복 전역/속성 조회를 줄이기 위해 지역 변수로 바인딩
+        loads = _loads
+        decode_error = json.JSONDecodeError
+        ack_event = self._ack_event
+
         while self._listening and self._reader:
             try:
                 line = await self._reader.readline()
@@ -94,29 +143,32 @@ class ControlSender(IControlNodeSender):
                     self._logger.warning("Connection closed by control node")
                     break
 
-                text = line.decode().strip()
-
-                # ACK 응답 처리
-                if text == "ACK":
+                # ACK 응답 처리 (일반적인 b"ACK\n"은 strip 없이 바로 판별)
+                if line == _ACK_LINE or line.strip() == _ACK:
                     self._ack_received = True
-                    self._ack_event.set()
+                    ack_event.set()
                     self._logger.debug("ACK received from control node")
                     continue
 
-                # JSON 데이터 파싱
+                # 콜백이 없으면 센서 데이터를 파싱할 필요 없음
+                if not self._sensor_callback:
+                    continue
+
+                # JSON 데이터 파싱 (앞뒤 공백/개행은 파서가 허용)
                 try:
-                    data = json.loads(text)
+                    data = loads(line)
 
-                    # inflated_zones 필드가 있으면 센서 데이터로 처리
-                    if "inflated_zones" in data and self._sensor_callback:
+                    # inflated_zones 필드가 있는 객체만 센서 데이터로 처리
+                    if isinstance(data, dict) and "inflated_zones" in data:
                         await self._sensor_callback(data)
-                        self._logger.info(f"Received sensor data: {data}")
+                        self._logger.info("Received sensor data: %s", data)
 
-                except json.JSONDecodeError as e:
-                    self._logger.warning(f"Invalid JSON received: {e}, raw: {text}")
+                except decode_error as e:
+                    # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+                    self._logger.warning("Invalid JSON received: %s, raw: %r", e, line)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self._logger.error(f"Error in listen loop: {e}")
+                self._logger.error("Error in listen loop: %s", e)
                 await asyncio.sleep(1)  # 에러 발생 시 잠시 대기
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import firebase_admin
 from firebase_admin import credentials, messaging
 
@@ -5,35 +9,103 @@ from interfaces.communication import INotifier
 from domain.models import AlertMessage
 
 
+MAX_BATCH_SIZE = 500  # messaging.send_each 1회 호출당 최대 메시지 수
+
+
 class FCMNotifier(INotifier):
     """Firebase Cloud Messaging 알림 구현체 (e)"""
 
     def __init__(self, credentials_path: str):
         self._credentials_path = credentials_path
         self._initialized = False
+        self._logger = logging.getLogger("fcm_notifier")
+        self._android_configs: dict[str, messaging.AndroidConfig] = {}
+
+        # 전송 대기 큐 (메시지, 결과 Future) - 백그라운드 태스크가 배치로 전송
+        self._queue: asyncio.Queue[tuple[messaging.Message, asyncio.Future]] = asyncio.Queue()
+        self._sender_task: asyncio.Task | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     def initialize(self) -> None:
         """Firebase 초기화"""
         if not self._initialized:
             cred = credentials.Certificate(self._credentials_path)
             firebase_admin.initialize_app(cred)
+            # 전송 태스크가 배치를 순차 전송하므로 워커 1개로 충분
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fcm")
+            self._android_configs = {
+                "high": messaging.AndroidConfig(priority="high"),
+                "normal": messaging.AndroidConfig(priority="normal"),
+            }
             self._initialized = True
 
     async def send_notification(self, message: AlertMessage) -> bool:
-        """푸시 알림 전송"""
+        """푸시 알림 전송 (큐에 등록 후 배치 전송 결과 대기)"""
         if not self._initialized:
             self.initialize()
 
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._sender_loop())
+
         notification = messaging.Message(
             notification=messaging.Notification(
                 title=message.title,
                 body=message.body,
             ),
             topic=f"patient_{message.patient_id}",
-            android=messaging.AndroidConfig(
-                priority="high" if message.priority == "high" else "normal",
-            ),
+            android=self._android_configs["high" if message.priority == "high" else "normal"],
         )
 
-        response = messaging.send(notification)
-        return bool(response)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((notification, future))
+        return await future
+
+    async def _sender_loop(self) -> None:
+        """대기 중인 알림을 모아 messaging.send_each로 전송하는 루프"""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < MAX_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                # 블로킹 HTTPS 호출은 전용 스레드에서 실행 (기본 executor와 분리)
+                response = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, messaging.send_each, [notification for notification, _ in batch]
+                )
+            except asyncio.CancelledError:
+                # 종료 중 취소되면 결과를 기다리는 호출자도 함께 취소
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                self._logger.error("Failed to send notifications: %s", e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, response.responses):
+                if not result.success:
+                    self._logger.warning("Notification rejected: %s", result.exception)
+                if not future.done():
+                    future.set_result(result.success)
+
+    async def close(self) -> None:
+        """전송 태스크 취소 및 전송 스레드 종료 (대기 중인 알림은 실패로 처리)"""
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            try:
+                await self._sender_task
+            except asyncio.CancelledError:
+                pass
+            self._sender_task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+
+        if self._executor is not None:
+            # 진행 중인 send_each가 끝날 때까지 이벤트 루프를 막지 않고 대기
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
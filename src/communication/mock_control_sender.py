@@ -3,7 +3,7 @@ import logging
 import random
 from typing import Callable, Awaitable
 
-from interfaces.communication import IControlNodeSender
+from interfaces.communication import IControlNodeSender, ControlNodeConnectionError
 from domain.models import ControlPacket
 
 
@@ -19,6 +19,8 @@ class MockControlSender(IControlNodeSender):
         self._listen_task: asyncio.Task | None = None
         self._logger = logging.getLogger("mock_control_sender")
         self._connected = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._rng = random.Random()
 
     async def connect(self) -> None:
         """Mock 연결 (항상 성공)"""
@@ -34,10 +36,11 @@ class MockControlSender(IControlNodeSender):
     async def send_packet(self, packet: ControlPacket) -> bool:
         """패킷 전송 Mock (항상 성공, 로그 출력)"""
         if not self._connected:
-            raise ConnectionError("Not connected to mock control node")
+            raise ControlNodeConnectionError("Not connected to mock control node")
 
         self._logger.info(f"[TEST MODE] 패킷 전송: posture={packet.posture.value}")
-        self._logger.debug(f"[TEST MODE] 패킷 상세: {packet.to_dict()}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"[TEST MODE] 패킷 상세: {packet.to_dict()}")
 
         # Mock ACK (항상 성공)
         return True
@@ -52,6 +55,7 @@ class MockControlSender(IControlNodeSender):
             return
 
         self._listening = True
+        self._loop = asyncio.get_running_loop()
         self._listen_task = asyncio.create_task(self._mock_listen_loop())
         self._logger.info("[TEST MODE] Mock 센서 데이터 수신 시작")
 
@@ -88,11 +92,11 @@ class MockControlSender(IControlNodeSender):
     def _generate_mock_sensor_data(self) -> dict:
         """Mock 센서 데이터 생성"""
         # 랜덤하게 0~3개의 zone을 활성화
-        num_zones = random.randint(0, 3)
-        zones = random.sample(range(1, 8), num_zones) if num_zones > 0 else []
+        num_zones = self._rng.randint(0, 3)
+        zones = self._rng.sample(range(1, 8), num_zones) if num_zones > 0 else []
 
         return {
             "inflated_zones": zones,
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": self._loop.time(),
             "mock": True,  # 테스트 데이터 표시
         }
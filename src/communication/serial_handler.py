@@ -1,33 +1,127 @@
 import asyncio
 import re
-import logging
-import threading
+import sys
 import time
+import logging
 from typing import Optional, Callable
-from datetime import datetime
 from glob import glob
 
 import numpy as np
-import serial
+import serial_asyncio
 
 from interfaces.communication import ISerialReader
 
 
 BOARDS = [f"UNO{i}_" for i in range(0, 7)]  # UNO0_ ~ UNO6_
 HEAD_BOARD = "UNO0_"
+MAX_CHANNELS = 14  # 보드당 최대 채널 수 (body 보드 2행 × 7열)
+
+# 보드별 채널 키 (UNO{n}_C0 ~ UNO{n}_C13) - 파싱/변환 시 같은 문자열 객체를 재사용하도록 intern
+CHANNEL_KEYS: dict[str, tuple[str, ...]] = {
+    board: tuple(sys.intern(f"{board}C{c}") for c in range(MAX_CHANNELS)) for board in BOARDS
+}
+
+
+def _build_slot_table() -> list[tuple[str, tuple[tuple[str, int, int], ...]]]:
+    """보드 채널 키를 head/body 매트릭스 위치로 매핑하는 테이블 생성 (출력 배열 번호 0: head, 1: body)"""
+    table = []
+    for idx, board in enumerate(BOARDS):
+        if board == HEAD_BOARD:
+            # UNO0: head (2, 3) - C0~C2 → row 0, C3~C5 → row 1
+            slots = tuple((CHANNEL_KEYS[board][c], 0, c) for c in range(6))
+        else:
+            # UNO1~UNO6: body (12, 7) - C0~C6 → 상단 행, C7~C13 → 하단 행
+            offset = (idx - 1) * 14
+            slots = tuple((CHANNEL_KEYS[board][c], 1, offset + c) for c in range(MAX_CHANNELS))
+        table.append((board, slots))
+    return table
+
+
+SLOT_TABLE = _build_slot_table()
+
+
+# 바이너리 프레임: 0xAA | board_id | nchan | nchan × int16(LE) | crc8 | 0x0A
+# 텍스트 라인과 같이 개행으로 끝나므로 readline() 한 번에 프레임 하나를 읽고,
+# 손상된 프레임은 다음 개행에서 자동으로 재동기화된다.
+# 시작 바이트 이후의 0x0A/0xDB는 SLIP 방식으로 이스케이프 (0x0A → 0xDB 0xDC, 0xDB → 0xDB 0xDD)
+FRAME_START = 0xAA
+FRAME_END = b"\n"
+_ESC = b"\xDB"
+_ESC_END = b"\xDB\xDC"
+_ESC_ESC = b"\xDB\xDD"
+
+
+def _build_crc8_table(poly: int = 0x07) -> tuple[int, ...]:
+    """CRC-8 룩업 테이블 생성"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC8_TABLE = _build_crc8_table()
+
+
+def crc8(data: bytes) -> int:
+    """CRC-8 (poly 0x07) 계산"""
+    crc = 0
+    for byte in data:
+        crc = _CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+def encode_frame(board_id: int, values: list[int]) -> bytes:
+    """보드 값을 바이너리 프레임으로 인코딩 (펌웨어와 같은 형식, 시뮬레이터/테스트용)"""
+    body = bytes((board_id, len(values))) + np.asarray(values, dtype="<i2").tobytes()
+    body += bytes((crc8(body),))
+    escaped = body.replace(_ESC, _ESC_ESC).replace(FRAME_END, _ESC_END)
+    return bytes((FRAME_START,)) + escaped + FRAME_END
+
+
+def decode_frame(line: bytes) -> Optional[tuple[int, list[int]]]:
+    """개행까지 읽은 바이너리 프레임 디코딩
+
+    Returns:
+        (board_id, 채널 값 목록), 길이/헤더/CRC가 맞지 않으면 None
+    """
+    if not line.endswith(FRAME_END):
+        return None  # 개행 전에 연결이 끊긴 불완전 프레임
+
+    # 이스케이프 해제 (0xDB는 항상 이스케이프 시작 바이트이므로 순서대로 치환해도 안전)
+    body = line[1:-1].replace(_ESC_END, FRAME_END).replace(_ESC_ESC, _ESC)
+    if len(body) < 3:
+        return None
+
+    board_id, nchan = body[0], body[1]
+    if board_id >= len(BOARDS) or nchan > MAX_CHANNELS or len(body) != nchan * 2 + 3:
+        return None
+    if crc8(body[:-1]) != body[-1]:
+        return None
+
+    return board_id, np.frombuffer(body, dtype="<i2", count=nchan, offset=2).tolist()
+
+
+# 포맷 1: UNO{n}_Ck:v (보드, 채널, 값을 한 번에 캡처)
+_PAT_UNO = re.compile(r"\b(UNO[0-6]_)C(\d+)\s*[:=]\s*(-?\d+)\b")
+# 포맷 2: [UNO{n}] Ck=v
+_PAT_BRACKET = re.compile(r"\[\s*(UNO[0-6])\s*\]\s*")
+_PAT_CHANNEL = re.compile(r"\bC\s*(\d+)\s*[:=]\s*(-?\d+)\b")
 
 
 class BoardData:
     """단일 보드의 데이터"""
 
-    def __init__(self, board: str, receive_time: datetime, data: dict):
+    def __init__(self, board: str, receive_time: float, data: dict):
         self.board = board
-        self.receive_time = receive_time
+        self.receive_time = receive_time  # time.monotonic() 기준 수신 시각
         self.data = data
 
 
 class SerialHandler(ISerialReader):
-    """시리얼 통신 구현체 - 멀티포트 지원"""
+    """시리얼 통신 구현체 - 멀티포트 지원 (포트별 asyncio 태스크)"""
 
     def __init__(self, baudrate: int = 115200, timeout: float = 2.0):
         self._baudrate = baudrate
@@ -36,14 +130,19 @@ class SerialHandler(ISerialReader):
 
         # 멀티포트 관련
         self._ports: list[str] = []
-        self._threads: list[threading.Thread] = []
-        self._stop_event = threading.Event()
+        self._tasks: dict[str, asyncio.Task] = {}  # 포트 -> 수신 태스크
 
-        # 보드 데이터 (스레드 간 공유)
+        # 보드 데이터 (모든 태스크가 같은 이벤트 루프에서 실행되므로 락 불필요)
         self._boards: dict[str, BoardData] = {}
-        self._boards_lock = threading.Lock()
-        self._update_cv = threading.Condition(self._boards_lock)
-        self._revision = 0
+        self._data_ready = asyncio.Event()
+
+        # 보드별 (채널 키, 출력 배열 번호, flat 인덱스) 테이블 (모든 인스턴스가 공유)
+        self._slot_table = SLOT_TABLE
+
+        # 매트릭스 변환용 재사용 버퍼 (flat 뷰로 접근)
+        self._head_buf = np.zeros((2, 3), dtype=np.float32)
+        self._body_buf = np.zeros((12, 7), dtype=np.float32)
+        self._flat_bufs = (self._head_buf.reshape(-1), self._body_buf.reshape(-1))
 
     def _find_ports(self) -> list[str]:
         """사용 가능한 시리얼 포트 탐색"""
@@ -52,120 +151,158 @@ class SerialHandler(ISerialReader):
         return ports
 
     def connect(self) -> None:
-        """시리얼 포트 연결 및 스레드 시작"""
+        """시리얼 포트 연결 및 포트별 수신 태스크 시작 (이벤트 루프 내에서 호출)"""
         self._ports = self._find_ports()
         if not self._ports:
             raise ConnectionError("사용 가능한 시리얼 포트가 없습니다")
 
-        self._stop_event.clear()
-        self._start_threads()
+        # 재연결 시 이미 수신 중인 포트는 그대로 두고, 종료된 태스크만 새로 시작
+        # (같은 tty에 수신 태스크가 중복되면 바이트를 나눠 읽게 됨)
+        loop = asyncio.get_running_loop()
+        for port in self._ports:
+            task = self._tasks.get(port)
+            if task is not None and not task.done():
+                continue
+            self._tasks[port] = loop.create_task(self._serial_reader(port), name=f"Serial-{port}")
+            self._logger.info(f"수신 태스크 시작: {port}")
         self._logger.info(f"{len(self._ports)}개 포트 연결 완료")
 
     def disconnect(self) -> None:
         """모든 시리얼 연결 해제"""
-        self._stop_event.set()
-        for thread in self._threads:
-            thread.join(timeout=3.0)
-        self._threads.clear()
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
         self._ports.clear()
-        self._logger.info("모든 시리얼 스레드 종료")
-
-    def _start_threads(self) -> None:
-        """각 포트별 스레드 시작"""
-        for port in self._ports:
-            thread = threading.Thread(
-                target=self._serial_thread,
-                args=(port,),
-                daemon=True,
-                name=f"Serial-{port}"
-            )
-            self._threads.append(thread)
-            thread.start()
-            self._logger.info(f"스레드 시작: {port}")
+        self._logger.info("모든 시리얼 수신 태스크 종료")
 
-    def _serial_thread(self, port: str) -> None:
-        """개별 포트 읽기 스레드"""
-        s = None
+    async def _serial_reader(self, port: str) -> None:
+        """개별 포트 읽기 태스크"""
+        writer = None
         try:
-            s = serial.Serial(port, self._baudrate, timeout=self._timeout)
+            reader, writer = await serial_asyncio.open_serial_connection(
+                url=port, baudrate=self._baudrate
+            )
             self._logger.info(f"[{port}] 연결 성공")
 
-            # 아두이노 리셋 대기
-            time.sleep(2.0)
-            s.reset_input_buffer()
+            # 아두이노 리셋 대기 (대기 중에는 수신을 멈추고, 끝나면 쌓인 입력 버퍼를 비움)
+            transport = writer.transport
+            transport.pause_reading()
+            await asyncio.sleep(2.0)
+            transport.serial.reset_input_buffer()
+            transport.resume_reading()
             self._logger.info(f"[{port}] 버퍼 초기화 완료")
 
-            while not self._stop_event.is_set():
-                line = s.readline()
-                if not line:
-                    continue
+            # 루프 내 반복 속성 조회를 줄이기 위해 지역 변수로 바인딩
+            read_frame = self._read_frame
+            parse = self._parse
+            boards = self._boards
+            notify = self._data_ready.set
+            monotonic = time.monotonic
+
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    self._logger.warning(f"[{port}] 포트 연결 종료")
+                    break
 
-                try:
-                    line = line.decode("utf-8").strip()
-                except UnicodeDecodeError:
-                    self._logger.warning(f"[{port}] Unicode decode error")
-                    continue
+                now = monotonic()
+                if raw[0] == FRAME_START:
+                    # 바이너리 프레임
+                    data = read_frame(raw, port, now)
+                else:
+                    # 텍스트 프로토콜 (구버전 펌웨어 호환)
+                    try:
+                        line = raw.decode("utf-8").strip()
+                    except UnicodeDecodeError:
+                        self._logger.warning(f"[{port}] Unicode decode error")
+                        continue
+                    data = parse(line, port, now)
 
-                data = self._parse(line, port)
                 if not data:
                     continue
 
-                with self._update_cv:
-                    self._boards[data.board] = data
-                    self._revision += 1
-                    self._update_cv.notify_all()
+                boards[data.board] = data
+                notify()
 
         except Exception as e:
-            self._logger.error(f"[{port}] 스레드 오류: {e}")
+            self._logger.error(f"[{port}] 수신 태스크 오류: {e}")
         finally:
-            if s is not None:
+            if writer is not None:
                 try:
-                    s.close()
+                    writer.close()
                     self._logger.info(f"[{port}] 연결 해제")
                 except Exception:
                     pass
 
-    def _parse(self, line: str, port: str) -> Optional[BoardData]:
-        """텍스트 라인 파싱"""
-        line = line.strip()
+    def _read_frame(self, raw: bytes, port: str, now: float) -> Optional[BoardData]:
+        """readline()으로 읽은 바이너리 프레임 파싱"""
+        frame = decode_frame(raw)
+        if frame is None:
+            self._logger.warning(f"[{port}] 잘못된 바이너리 프레임 ({len(raw)} bytes)")
+            return None
+
+        board_id, values = frame
+        board = BOARDS[board_id]
+        return BoardData(board, now, dict(zip(CHANNEL_KEYS[board], values)))
+
+    def _parse(
+        self,
+        line: str,
+        port: str,
+        now: float,
+        _pat_uno: re.Pattern = _PAT_UNO,
+        _pat_bracket: re.Pattern = _PAT_BRACKET,
+        _pat_channel: re.Pattern = _PAT_CHANNEL,
+        _int: type = int,
+    ) -> Optional[BoardData]:
+        """텍스트 라인 파싱
+
+        패턴과 int는 라인마다 전역 조회를 피하기 위해 기본 인자로 바인딩합니다 (호출 시 전달하지 않음).
+        """
+        # 대소문자 구분 없는 매칭 대신 라인을 한 번만 대문자로 변환
+        line = line.strip().upper()
         if not line:
             return None
 
-        # 포맷 1: UNO{n}_Ck:v
-        matched = re.search(r"\b(UNO[0-6]_)C\d+\s*[:=]\s*-?\d+\b", line, flags=re.IGNORECASE)
-        if matched:
-            board = matched.group(1).upper()
-            data = {}
-            for m in re.finditer(rf"({board}C(\d+))\s*[:=]\s*(-?\d+)", line, flags=re.IGNORECASE):
-                ch = int(m.group(2))
-                val = int(m.group(3))
-                data[f"{board}C{ch}"] = val
-            self._logger.debug(f"[{port}] UNO 포맷 파싱: {board} -> {data}")
-            return BoardData(board, datetime.now(), data)
+        # 포맷 1: UNO{n}_Ck:v - 첫 번째로 매칭된 보드의 채널만 수집
+        board = None
+        keys = ()
+        data = {}
+        for m in _pat_uno.finditer(line):
+            matched_board = m.group(1)
+            if board is None:
+                board = matched_board
+                keys = CHANNEL_KEYS[board]
+            elif matched_board != board:
+                continue
+            ch = _int(m.group(2))
+            data[keys[ch] if ch < MAX_CHANNELS else f"{board}C{ch}"] = _int(m.group(3))
+        if board is not None:
+            self._logger.debug("[%s] UNO 포맷 파싱: %s -> %s", port, board, data)
+            return BoardData(board, now, data)
 
         # 포맷 2: [UNO{n}] Ck=v
-        matched = re.search(r"\[\s*(UNO[0-6])\s*\]", line, flags=re.IGNORECASE)
+        matched = _pat_bracket.search(line)
         if matched:
-            bnorm = matched.group(1).upper()
-            board = f"{bnorm}_"
-            rest = re.sub(r"^\s*\[\s*" + bnorm + r"\s*\]\s*", "", line, flags=re.IGNORECASE)
+            board = f"{matched.group(1)}_"
+            keys = CHANNEL_KEYS[board]
             data = {}
-            for m in re.finditer(r"\bC\s*(\d+)\s*[:=]\s*(-?\d+)\b", rest):
-                ch = int(m.group(1))
-                val = int(m.group(2))
-                data[f"{board}C{ch}"] = val
-            self._logger.debug(f"[{port}] 브래킷 포맷 파싱: {board} -> {data}")
-            return BoardData(board, datetime.now(), data)
-
-        self._logger.debug(f"[{port}] 파싱 실패: {line[:50]}")
+            for m in _pat_channel.finditer(line, matched.end()):
+                ch = _int(m.group(1))
+                data[keys[ch] if ch < MAX_CHANNELS else f"{board}C{ch}"] = _int(m.group(2))
+            self._logger.debug("[%s] 브래킷 포맷 파싱: %s -> %s", port, board, data)
+            return BoardData(board, now, data)
+
+        self._logger.debug("[%s] 파싱 실패: %.50s", port, line)
         return None
 
     def _convert_to_matrix(self) -> tuple[np.ndarray, np.ndarray]:
         """축적된 보드 데이터를 head (2, 3), body (12, 7) 매트릭스로 변환"""
-        head = np.zeros((2, 3), dtype=np.float32)
-        body = np.zeros((12, 7), dtype=np.float32)
+        self._head_buf.fill(0)
+        self._body_buf.fill(0)
+        outputs = self._flat_bufs
 
-        for idx, board in enumerate(BOARDS):
+        for board, slots in self._slot_table:
             board_data = self._boards.get(board)
             if not board_data:
                 continue
@@ -173,63 +310,39 @@ class SerialHandler(ISerialReader):
             if not data:
                 continue
 
-            top = 2 * idx
-            bottom = top + 1
-
-            if board == HEAD_BOARD:
-                # UNO0: head (2, 3) - C0~C2 → row 0, C3~C5 → row 1
-                for c in range(3):
-                    val = data.get(f"{board}C{c}")
-                    if val is not None:
-                        head[0][c] = val
-                for c in range(3):
-                    val = data.get(f"{board}C{3 + c}")
-                    if val is not None:
-                        head[1][c] = val
-            else:
-                # UNO1~UNO6: body (12, 7)
-                body_top = top - 2
-                body_bottom = bottom - 2
-                for c in range(7):
-                    val = data.get(f"{board}C{c}")
-                    if val is not None:
-                        body[body_top][c] = val
-                for c in range(7):
-                    val = data.get(f"{board}C{7 + c}")
-                    if val is not None:
-                        body[body_bottom][c] = val
-
-        return head, body
+            for key, out, index in slots:
+                val = data.get(key)
+                if val is not None:
+                    outputs[out][index] = val
+
+        # 호출자가 버퍼를 보관/수정해도 다음 변환에 영향이 없도록 복사본 반환
+        return self._head_buf.copy(), self._body_buf.copy()
 
     def read(self, timeout: float = 5.0) -> tuple[np.ndarray, np.ndarray]:
         """현재 수집된 데이터 반환 (동기)
 
-        Args:
-            timeout: 최소 1개 보드 데이터 수신 대기 시간
+        수신 태스크와 같은 이벤트 루프를 막지 않도록 대기하지 않고
+        현재까지 수집된 데이터를 즉시 반환합니다. 대기가 필요하면 async_read를 사용합니다.
 
         Returns:
             tuple: (head (2, 3), body (12, 7))
         """
-        start_time = time.time()
-
-        # 최소 1개 이상의 보드 데이터가 있을 때까지 대기
-        with self._update_cv:
-            while not self._boards:
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    self._logger.warning("데이터 수신 타임아웃")
-                    break
-                self._update_cv.wait(timeout=remaining)
-
-        with self._boards_lock:
-            head, body = self._convert_to_matrix()
-
-        return head, body
+        return self._convert_to_matrix()
 
     async def async_read(self, timeout: float = 5.0) -> tuple[np.ndarray, np.ndarray]:
         """현재 수집된 데이터 반환 (비동기)
 
+        Args:
+            timeout: 최소 1개 보드 데이터 수신 대기 시간
+
         Returns:
             tuple: (head (2, 3), body (12, 7))
         """
-        return await asyncio.to_thread(self.read, timeout)
+        # 최소 1개 이상의 보드 데이터가 있을 때까지 대기
+        if not self._boards:
+            try:
+                await asyncio.wait_for(self._data_ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                self._logger.warning("데이터 수신 타임아웃")
+
+        return self._convert_to_matrix()
@@ -1,13 +1,42 @@
+import base64
+import time
 import logging
 import asyncio
 from typing import Optional
 
+import httpx
 import numpy as np
-from supabase import create_async_client, AsyncClient
+from supabase import create_async_client, AsyncClient, AsyncClientOptions
 
 from interfaces.communication import IServerClient
 from domain.models import Patient, DeviceData, DayLog, PressureLog
 
+try:
+    import h2  # noqa: F401 - httpx HTTP/2 지원 여부 확인용
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Supabase 하위 클라이언트(PostgREST 등)가 공유하는 커넥션 풀 설정 (매 사이클 호출 간 keep-alive 유지)
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+
+# 조회 컬럼 (from_dict가 사용하는 컬럼만 고정 순서로 요청)
+DEVICE_COLUMNS = "id,created_at,controls,activate_air"
+PATIENT_COLUMNS = (
+    "id,device_id,created_at,occiput_threshold,scapula_threshold,"
+    "relbow_threshold,lelbow_threshold,hip_threshold,rheel_threshold,lheel_threshold"
+)
+DAYLOG_COLUMNS = (
+    "id,day,device_id,total_occiput,total_scapula,"
+    "total_relbow,total_lelbow,total_hip,total_rheel,total_lheel"
+)
+
+# 조회 결과 캐시 유효 시간 (초)
+PATIENT_CACHE_TTL = 60.0
+DEVICE_CACHE_TTL = 5.0  # controls/activate_air는 서버에서 변경될 수 있어 짧게 유지
+
 
 class SupabaseClient(IServerClient):
     """Supabase 서버 통신 구현체"""
@@ -16,8 +45,32 @@ class SupabaseClient(IServerClient):
         self._url = url
         self._key = key
         self._client: Optional[AsyncClient] = None
+        self._http_client: Optional[httpx.AsyncClient] = None  # Supabase 클라이언트에 주입한 httpx 클라이언트
         self._logger = logging.getLogger("supabase_client")
         self._device_channels: dict[int, any] = {}
+        self._channel_locks: dict[int, asyncio.Lock] = {}  # 디바이스별 채널 생성 락
+        self._init_lock = asyncio.Lock()  # 동시 initialize 호출 시 클라이언트 중복 생성 방지
+        # (테이블, device_id) -> (조회 결과, 만료 시각)
+        self._cache: dict[tuple[str, int], tuple[object, float]] = {}
+
+    def _cache_get(self, table: str, device_id: int):
+        """캐시된 조회 결과 반환 (없거나 만료 시 None)"""
+        entry = self._cache.get((table, device_id))
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[(table, device_id)]
+            return None
+        return value
+
+    def _cache_put(self, table: str, device_id: int, value: object, ttl: float) -> None:
+        """조회 결과 캐시 저장"""
+        self._cache[(table, device_id)] = (value, time.monotonic() + ttl)
+
+    def _cache_invalidate(self, table: str, device_id: int) -> None:
+        """캐시 무효화"""
+        self._cache.pop((table, device_id), None)
 
     async def initialize(self) -> None:
         """비동기 초기화"""
@@ -25,12 +78,42 @@ class SupabaseClient(IServerClient):
             self._logger.error("Supabase URL and API key must be configured")
             return
 
+        if self._client is not None:
+            return
+
+        async with self._init_lock:
+            if self._client is not None:
+                return
+            # 풀 설정은 supabase-py의 httpx_client 옵션으로 주입 (PostgREST/Auth/Storage/Functions 공용)
+            http_client = httpx.AsyncClient(
+                limits=HTTP_LIMITS,
+                timeout=HTTP_TIMEOUT,
+                http2=_HTTP2,
+                follow_redirects=True,
+            )
+            try:
+                self._client = await create_async_client(
+                    self._url, self._key, options=AsyncClientOptions(httpx_client=http_client)
+                )
+                self._http_client = http_client
+                self._logger.info("Supabase client initialized successfully")
+            except Exception as e:
+                await http_client.aclose()
+                self._logger.error("Failed to initialize Supabase client: %s", e)
+
+    async def close(self) -> None:
+        """HTTP 세션 종료"""
+        if not self._client:
+            return
+
         try:
-            self._client = await create_async_client(self._url, self._key)
-            self._logger.info("Supabase client initialized successfully")
+            await self._http_client.aclose()
+            self._logger.info("Supabase client closed")
         except Exception as e:
-            self._logger.error(f"Failed to initialize Supabase client: {e}")
-            self._client = None
+            self._logger.error("Error closing Supabase client: %s", e)
+        self._client = None
+        self._http_client = None
+        self._cache.clear()
 
     # Device 관련
     async def async_fetch_device(self, device_id: int) -> Optional[DeviceData]:
@@ -39,16 +122,22 @@ class SupabaseClient(IServerClient):
             self._logger.error("Supabase client is not initialized")
             return None
 
+        cached = self._cache_get("devices", device_id)
+        if cached is not None:
+            return cached
+
         try:
-            self._logger.info(f"Fetching device with id: {device_id}")
-            response = await self._client.table("devices").select("*").eq("id", device_id).execute()
+            self._logger.info("Fetching device with id: %s", device_id)
+            response = await self._client.table("devices").select(DEVICE_COLUMNS).eq("id", device_id).execute()
             if response.data:
-                self._logger.info(f"Device found: {device_id}")
-                return DeviceData.from_dict(response.data[0])
-            self._logger.warning(f"Device not found: {device_id}")
+                self._logger.info("Device found: %s", device_id)
+                device = DeviceData.from_dict(response.data[0])
+                self._cache_put("devices", device_id, device, DEVICE_CACHE_TTL)
+                return device
+            self._logger.warning("Device not found: %s", device_id)
             return None
         except Exception as e:
-            self._logger.error(f"Error fetching device {device_id}: {e}")
+            self._logger.error("Error fetching device %s: %s", device_id, e)
             return None
 
     async def async_create_device(self, device: DeviceData) -> Optional[DeviceData]:
@@ -58,15 +147,16 @@ class SupabaseClient(IServerClient):
             return None
 
         try:
-            self._logger.info(f"Creating device with id: {device.id}")
+            self._logger.info("Creating device with id: %s", device.id)
+            self._cache_invalidate("devices", device.id)
             response = await self._client.table("devices").insert(device.to_dict()).execute()
             if response.data:
-                self._logger.info(f"Device created successfully: {device.id}")
+                self._logger.info("Device created successfully: %s", device.id)
                 return DeviceData.from_dict(response.data[0])
-            self._logger.warning(f"Device creation returned no data: {device.id}")
+            self._logger.warning("Device creation returned no data: %s", device.id)
             return None
         except Exception as e:
-            self._logger.error(f"Error creating device {device.id}: {e}")
+            self._logger.error("Error creating device %s: %s", device.id, e)
             return None
 
     # Patient 관련
@@ -76,16 +166,22 @@ class SupabaseClient(IServerClient):
             self._logger.error("Supabase client is not initialized")
             return None
 
+        cached = self._cache_get("patients", device_id)
+        if cached is not None:
+            return cached
+
         try:
-            self._logger.info(f"Fetching patient with device_id: {device_id}")
-            response = await self._client.table("patients").select("*").eq("device_id", device_id).execute()
+            self._logger.info("Fetching patient with device_id: %s", device_id)
+            response = await self._client.table("patients").select(PATIENT_COLUMNS).eq("device_id", device_id).execute()
             if response.data:
-                self._logger.info(f"Patient found for device: {device_id}")
-                return Patient.from_dict(response.data[0])
-            self._logger.warning(f"No patient found for device: {device_id}")
+                self._logger.info("Patient found for device: %s", device_id)
+                patient = Patient.from_dict(response.data[0])
+                self._cache_put("patients", device_id, patient, PATIENT_CACHE_TTL)
+                return patient
+            self._logger.warning("No patient found for device: %s", device_id)
             return None
         except Exception as e:
-            self._logger.error(f"Error fetching patient with device {device_id}: {e}")
+            self._logger.error("Error fetching patient with device %s: %s", device_id, e)
             return None
 
     # DayLog 관련
@@ -96,17 +192,15 @@ class SupabaseClient(IServerClient):
             return daylog
 
         try:
-            self._logger.info(f"Creating daylog for device: {daylog.device_id}, day: {daylog.day}")
-            data = daylog.to_dict()
-            del data["id"]  # id는 서버에서 생성
-            response = await self._client.table("day_logs").insert(data).execute()
+            self._logger.info("Creating daylog for device: %s, day: %s", daylog.device_id, daylog.day)
+            response = await self._client.table("day_logs").insert(daylog.to_insert_dict()).execute()
             if response.data:
-                self._logger.info(f"Daylog created successfully")
+                self._logger.info("Daylog created successfully")
                 return DayLog.from_dict(response.data[0])
-            self._logger.warning(f"Daylog creation returned no data for device: {daylog.device_id}")
+            self._logger.warning("Daylog creation returned no data for device: %s", daylog.device_id)
             return daylog
         except Exception as e:
-            self._logger.error(f"Error creating daylog for device {daylog.device_id}: {e}")
+            self._logger.error("Error creating daylog for device %s: %s", daylog.device_id, e)
             return daylog
 
     async def async_update_daylog(self, daylog: DayLog) -> Optional[DayLog]:
@@ -116,17 +210,55 @@ class SupabaseClient(IServerClient):
             return daylog
 
         try:
-            self._logger.info(f"Updating daylog: {daylog.id}")
+            self._logger.info("Updating daylog: %s", daylog.id)
             response = await self._client.table("day_logs").update(daylog.to_dict()).eq("id", daylog.id).execute()
             if response.data:
-                self._logger.info(f"Daylog updated successfully: {daylog.id}")
+                self._logger.info("Daylog updated successfully: %s", daylog.id)
                 return DayLog.from_dict(response.data[0])
-            self._logger.warning(f"Daylog update returned no data: {daylog.id}")
+            self._logger.warning("Daylog update returned no data: %s", daylog.id)
             return daylog
         except Exception as e:
-            self._logger.error(f"Error updating daylog {daylog.id}: {e}")
+            self._logger.error("Error updating daylog %s: %s", daylog.id, e)
             return None
 
+    async def async_upsert_daylog(self, daylog: DayLog) -> Optional[DayLog]:
+        """일별 로그 생성 또는 업데이트
+
+        서버 id를 이미 알면 id로 업데이트하고, 새 DayLog(id 0)는 (device_id, day) 기준으로 upsert.
+        upsert는 day_logs(device_id, day) 유니크 제약이 필요하며, 실패하면 날짜로 조회 후 업데이트/생성
+        """
+        if not self._client:
+            self._logger.error("Supabase client is not initialized")
+            return daylog
+
+        if daylog.id:
+            return await self.async_update_daylog(daylog)
+
+        try:
+            self._logger.info("Upserting daylog for device: %s, day: %s", daylog.device_id, daylog.day)
+            response = (
+                await self._client.table("day_logs")
+                .upsert(daylog.to_insert_dict(), on_conflict="device_id,day")
+                .execute()
+            )
+            if response.data:
+                self._logger.info("Daylog upserted successfully")
+                return DayLog.from_dict(response.data[0])
+            self._logger.warning("Daylog upsert returned no data for device: %s", daylog.device_id)
+        except Exception as e:
+            self._logger.warning(
+                "Daylog upsert failed for device %s (requires unique (device_id, day) on day_logs), "
+                "falling back to fetch and create: %s",
+                daylog.device_id,
+                e,
+            )
+
+        existing = await self.async_fetch_daylog_by_date(daylog.device_id, daylog.day.isoformat())
+        if existing:
+            daylog.id = existing.id
+            return await self.async_update_daylog(daylog)
+        return await self.async_create_daylog(daylog)
+
     async def async_fetch_daylog_by_date(self, device_id: int, day: str) -> Optional[DayLog]:
         """특정 날짜의 DayLog 조회"""
         if not self._client:
@@ -134,21 +266,21 @@ class SupabaseClient(IServerClient):
             return None
 
         try:
-            self._logger.info(f"Fetching daylog for device: {device_id}, day: {day}")
+            self._logger.info("Fetching daylog for device: %s, day: %s", device_id, day)
             response = (
                 await self._client.table("day_logs")
-                .select("*")
+                .select(DAYLOG_COLUMNS)
                 .eq("device_id", device_id)
                 .eq("day", day)
                 .execute()
             )
             if response.data:
-                self._logger.info(f"Daylog found for device: {device_id}, day: {day}")
+                self._logger.info("Daylog found for device: %s, day: %s", device_id, day)
                 return DayLog.from_dict(response.data[0])
-            self._logger.info(f"No daylog found for device: {device_id}, day: {day}")
+            self._logger.info("No daylog found for device: %s, day: %s", device_id, day)
             return None
         except Exception as e:
-            self._logger.error(f"Error fetching daylog: {e}")
+            self._logger.error("Error fetching daylog: %s", e)
             return None
 
     # PressureLog 관련
@@ -159,18 +291,17 @@ class SupabaseClient(IServerClient):
             return pressurelog
 
         try:
-            self._logger.info(f"Creating pressurelog for day: {pressurelog.day_id}")
-            data = pressurelog.to_dict()
-            del data["id"]  # id는 서버에서 생성
-            self._logger.info(f"Pressurelog data to insert: {data}")
+            self._logger.info("Creating pressurelog for day: %s", pressurelog.day_id)
+            data = pressurelog.to_insert_dict()  # id는 서버에서 생성
+            self._logger.debug("Pressurelog data to insert: %s", data)
             response = await self._client.table("pressure_logs").insert(data).execute()
             if response.data:
-                self._logger.info(f"Pressurelog created successfully")
+                self._logger.info("Pressurelog created successfully")
                 return PressureLog.from_dict(response.data[0])
-            self._logger.warning(f"Pressurelog creation returned no data")
+            self._logger.warning("Pressurelog creation returned no data")
             return pressurelog
         except Exception as e:
-            self._logger.error(f"Error creating pressurelog: {e}")
+            self._logger.error("Error creating pressurelog: %s", e)
             return None
 
     async def async_update_pressurelog(self, pressurelog: PressureLog) -> Optional[PressureLog]:
@@ -180,7 +311,7 @@ class SupabaseClient(IServerClient):
             return pressurelog
 
         try:
-            self._logger.info(f"Updating pressurelog: {pressurelog.id}")
+            self._logger.info("Updating pressurelog: %s", pressurelog.id)
             response = (
                 await self._client.table("pressure_logs")
                 .update(pressurelog.to_dict())
@@ -188,41 +319,65 @@ class SupabaseClient(IServerClient):
                 .execute()
             )
             if response.data:
-                self._logger.info(f"Pressurelog updated successfully: {pressurelog.id}")
+                self._logger.info("Pressurelog updated successfully: %s", pressurelog.id)
                 return PressureLog.from_dict(response.data[0])
-            self._logger.warning(f"Pressurelog update returned no data: {pressurelog.id}")
+            self._logger.warning("Pressurelog update returned no data: %s", pressurelog.id)
             return pressurelog
         except Exception as e:
-            self._logger.error(f"Error updating pressurelog {pressurelog.id}: {e}")
+            self._logger.error("Error updating pressurelog %s: %s", pressurelog.id, e)
             return None
 
+    # Realtime 채널
+    async def _get_channel(self, device_id: int):
+        """디바이스 Realtime 채널 반환 (없으면 생성 및 구독)
+
+        히트맵/controls 브로드캐스트가 같은 채널을 공유하며,
+        첫 호출이 동시에 들어와도 디바이스별 락으로 한 번만 구독합니다.
+        """
+        channel = self._device_channels.get(device_id)
+        if channel is not None:
+            return channel
+
+        lock = self._channel_locks.setdefault(device_id, asyncio.Lock())
+        async with lock:
+            channel = self._device_channels.get(device_id)
+            if channel is None:
+                channel = self._client.channel(f"{device_id}")
+                await channel.subscribe()
+                # 구독이 끝난 채널만 등록 (구독 실패 시 다음 호출에서 재시도)
+                self._device_channels[device_id] = channel
+                self._logger.info("Realtime channel subscribed for device %s", device_id)
+        return channel
+
     # Heatmap 실시간 업데이트
+    @staticmethod
+    def _encode_heatmap(heatmap: np.ndarray) -> dict:
+        """히트맵 브로드캐스트 페이로드 생성
+
+        기존 구독자 호환을 위해 "values"(평탄화 리스트)를 유지하고,
+        "v": 2 필드와 함께 little-endian float32 바이트(base64)를 추가로 싣는다.
+        v2 수신 측 복원: np.frombuffer(base64.b64decode(data), dtype="<f4").reshape(shape)
+        """
+        buffer = np.ascontiguousarray(heatmap, dtype="<f4")
+        return {
+            "values": buffer.ravel().tolist(),
+            "v": 2,
+            "dtype": "<f4",
+            "shape": list(heatmap.shape),
+            "data": base64.b64encode(buffer).decode("ascii"),
+        }
+
     async def async_update_heatmap(self, device_id: int, heatmap: np.ndarray) -> bool:
         """히트맵 실시간 업데이트 (Supabase Realtime)"""
         if not self._client:
             return False
 
         try:
-            if device_id in self._device_channels:
-                channel = self._device_channels[device_id]
-                await channel.send_broadcast(
-                    "heatmap_update",
-                    {"values": heatmap.flatten().tolist()},
-                )
-                return True
-
-            # 새 채널 생성 및 구독
-            channel = self._client.channel(f"{device_id}")
-            self._device_channels[device_id] = channel
-
-            await channel.subscribe()
-            await channel.send_broadcast(
-                "heatmap_update",
-                {"values": heatmap.flatten().tolist()},
-            )
+            channel = await self._get_channel(device_id)
+            await channel.send_broadcast("heatmap_update", self._encode_heatmap(heatmap))
             return True
         except Exception as e:
-            self._logger.error(f"Error updating heatmap for device {device_id}: {e}")
+            self._logger.error("Error updating heatmap for device %s: %s", device_id, e)
             return False
 
     async def async_fetch_device_controls(self, device_id: int) -> Optional[dict]:
@@ -231,6 +386,15 @@ class SupabaseClient(IServerClient):
             self._logger.error("Supabase client is not initialized")
             return None
 
+        # 디바이스 전체 조회 결과가 캐시되어 있으면 재사용
+        cached = self._cache_get("devices", device_id)
+        if cached is not None:
+            return cached.controls
+
+        cached = self._cache_get("device_controls", device_id)
+        if cached is not None:
+            return cached
+
         try:
             response = (
                 await self._client.table("devices")
@@ -239,10 +403,13 @@ class SupabaseClient(IServerClient):
                 .execute()
             )
             if response.data:
-                return response.data[0].get("controls")
+                controls = response.data[0].get("controls")
+                if controls is not None:
+                    self._cache_put("device_controls", device_id, controls, DEVICE_CACHE_TTL)
+                return controls
             return None
         except Exception as e:
-            self._logger.error(f"Error fetching controls for device {device_id}: {e}")
+            self._logger.error("Error fetching controls for device %s: %s", device_id, e)
             return None
 
     async def async_broadcast_controls(self, device_id: int, controls_data: dict) -> bool:
@@ -258,26 +425,22 @@ class SupabaseClient(IServerClient):
             return False
 
         try:
-            if device_id in self._device_channels:
-                channel = self._device_channels[device_id]
-                await channel.send_broadcast(
-                    "controls",
-                    controls_data,
-                )
-                self._logger.debug(f"Controls broadcasted for device {device_id}: {controls_data}")
-                return True
-
-            # 새 채널 생성 및 구독
-            channel = self._client.channel(f"{device_id}")
-            self._device_channels[device_id] = channel
-
-            await channel.subscribe()
-            await channel.send_broadcast(
-                "controls",
-                controls_data,
-            )
-            self._logger.info(f"New channel created and controls broadcasted for device {device_id}")
+            channel = await self._get_channel(device_id)
+            await channel.send_broadcast("controls", controls_data)
+            self._logger.debug("Controls broadcasted for device %s: %s", device_id, controls_data)
             return True
         except Exception as e:
-            self._logger.error(f"Error broadcasting controls for device {device_id}: {e}")
+            self._logger.error("Error broadcasting controls for device %s: %s", device_id, e)
             return False
+
+
+# (url, key)별 공유 인스턴스 (컨테이너를 여러 번 구성해도 클라이언트/커넥션 풀을 재사용)
+_shared_clients: dict[tuple[str, str], SupabaseClient] = {}
+
+
+def get_shared_client(url: str, key: str) -> SupabaseClient:
+    """(url, key)에 대한 공유 SupabaseClient 반환 (없으면 생성)"""
+    client = _shared_clients.get((url, key))
+    if client is None:
+        client = _shared_clients[(url, key)] = SupabaseClient(url, key)
+    return client
@@ -14,7 +14,7 @@ from interfaces.presentation import IDisplay
 
 # 구현체
 from communication.serial_handler import SerialHandler
-from communication.supabase_client import SupabaseClient
+from communication.supabase_client import get_shared_client
 from communication.control_sender import ControlSender
 from communication.mock_control_sender import MockControlSender
 from communication.fcm_notifier import FCMNotifier
@@ -46,7 +46,7 @@ def create_container(settings: Settings) -> Container:
 
     # 통신 계층 (멀티포트 자동 탐색)
     serial_reader = SerialHandler(settings.baudrate)
-    server_client = SupabaseClient(settings.supabase_url, settings.supabase_key)
+    server_client = get_shared_client(settings.supabase_url, settings.supabase_key)
 
     # 테스트 모드에서는 MockControlSender 사용
     if settings.test_mode:
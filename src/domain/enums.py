@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class PostureType(Enum):
@@ -13,12 +13,21 @@ class PostureType(Enum):
     SUPINE_RIGHT = 7    # 앙와위 + 오른쪽 다리 올림
 
 
-class BodyPart(Enum):
-    """압력 측정 신체 부위"""
-    OCCIPUT = "occiput"             # 후두부 (머리 뒤)
-    SCAPULA = "scapula"             # 견갑골 (어깨뼈)
-    RIGHT_ELBOW = "right_elbow"     # 오른쪽 팔꿈치
-    LEFT_ELBOW = "left_elbow"       # 왼쪽 팔꿈치
-    HIP = "hip"                     # 엉덩이
-    RIGHT_HEEL = "right_heel"       # 오른쪽 발뒤꿈치
-    LEFT_HEEL = "left_heel"         # 왼쪽 발뒤꿈치
+class BodyPart(IntEnum):
+    """압력 측정 신체 부위 (값은 부위별 배열 인덱스로 사용)"""
+    OCCIPUT = 0         # 후두부 (머리 뒤)
+    SCAPULA = 1         # 견갑골 (어깨뼈)
+    RIGHT_ELBOW = 2     # 오른쪽 팔꿈치
+    LEFT_ELBOW = 3      # 왼쪽 팔꿈치
+    HIP = 4             # 엉덩이
+    RIGHT_HEEL = 5      # 오른쪽 발뒤꿈치
+    LEFT_HEEL = 6       # 왼쪽 발뒤꿈치
+
+    @property
+    def key(self) -> str:
+        """외부 전송용 문자열 키 (예: "occiput")"""
+        return BODY_PART_KEYS[self]
+
+
+# BodyPart 값 순서의 문자열 키 (컨트롤 노드 패킷 등 외부 경계에서 사용)
+BODY_PART_KEYS: tuple[str, ...] = tuple(part.name.lower() for part in BodyPart)
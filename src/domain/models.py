@@ -1,13 +1,32 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, date
 
 from .enums import PostureType, BodyPart
 
 
-@dataclass
+# 서버 응답의 타임스탬프 파싱 (같은 행을 반복 조회하는 경우가 많아 결과를 캐시, datetime/date는 불변)
+@lru_cache(maxsize=256)
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=64)
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+# BodyPart 값 순서의 PressureLog 부위별 누적 시간 필드명
+_DURATION_FIELDS = ("occiput", "scapula", "right_elbow", "left_elbow", "hip", "right_heel", "left_heel")
+
+# Patient 임계값 테이블로 조회 가능한 BodyPart 값 (음수 인덱스나 정수 외 값은 기본값 처리)
+_BODY_PART_VALUES = frozenset(BodyPart)
+
+
+@dataclass(slots=True, frozen=True)
 class Patient:
-    """환자 정보 (서버에서 device_id로 조회)"""
+    """환자 정보 (서버에서 device_id로 조회, 임계값 캐시가 어긋나지 않도록 불변)"""
     id: int
     device_id: int
     created_at: datetime
@@ -23,7 +42,7 @@ class Patient:
     @staticmethod
     def from_dict(data: dict) -> "Patient":
         """서버 응답을 Patient 객체로 변환"""
-        created_at = datetime.fromisoformat(data["created_at"])
+        created_at = _parse_datetime(data["created_at"])
         return Patient(
             id=int(data["id"]),
             device_id=int(data.get("device_id") or 0),
@@ -37,21 +56,37 @@ class Patient:
             left_heel_threshold=int(data.get("lheel_threshold") or 120),
         )
 
+    # 부위별 임계값 조회 테이블 (BodyPart 값 순서, 생성 시 한 번만 구성)
+    _thresholds: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _thresholds_seconds: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        thresholds = (
+            self.occiput_threshold,
+            self.scapula_threshold,
+            self.right_elbow_threshold,
+            self.left_elbow_threshold,
+            self.hip_threshold,
+            self.right_heel_threshold,
+            self.left_heel_threshold,
+        )
+        # frozen dataclass이므로 파생 필드는 object.__setattr__로 설정
+        object.__setattr__(self, "_thresholds", thresholds)
+        object.__setattr__(self, "_thresholds_seconds", tuple(minutes * 60 for minutes in thresholds))
+
     def get_threshold(self, body_part: BodyPart) -> int:
-        """부위별 임계값 반환 (분 단위)"""
-        thresholds = {
-            BodyPart.OCCIPUT: self.occiput_threshold,
-            BodyPart.SCAPULA: self.scapula_threshold,
-            BodyPart.RIGHT_ELBOW: self.right_elbow_threshold,
-            BodyPart.LEFT_ELBOW: self.left_elbow_threshold,
-            BodyPart.HIP: self.hip_threshold,
-            BodyPart.RIGHT_HEEL: self.right_heel_threshold,
-            BodyPart.LEFT_HEEL: self.left_heel_threshold,
-        }
-        return thresholds.get(body_part, 120)
+        """부위별 임계값 반환 (분 단위, 알 수 없는 부위는 기본값 120)"""
+        if body_part in _BODY_PART_VALUES:
+            return self._thresholds[body_part]
+        return 120
+
+    @property
+    def thresholds_seconds(self) -> tuple[int, ...]:
+        """부위별 임계값 (초 단위, BodyPart 값으로 인덱싱)"""
+        return self._thresholds_seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceData:
     """디바이스 정보"""
     id: int
@@ -61,7 +96,7 @@ class DeviceData:
 
     @staticmethod
     def from_dict(data: dict) -> "DeviceData":
-        created_at = datetime.fromisoformat(data["created_at"])
+        created_at = _parse_datetime(data["created_at"])
         return DeviceData(
             id=int(data["id"]),
             created_at=created_at,
@@ -78,7 +113,7 @@ class DeviceData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DayLog:
     """일별 압력 누적 로그"""
     id: int
@@ -94,7 +129,7 @@ class DayLog:
 
     @staticmethod
     def from_dict(data: dict) -> "DayLog":
-        day = date.fromisoformat(data["day"])
+        day = _parse_date(data["day"])
         return DayLog(
             id=int(data["id"]),
             day=day,
@@ -109,8 +144,13 @@ class DayLog:
         )
 
     def to_dict(self) -> dict:
+        data = self.to_insert_dict()
+        data["id"] = self.id
+        return data
+
+    def to_insert_dict(self) -> dict:
+        """생성(insert/upsert)용 dict (id는 서버에서 생성)"""
         return {
-            "id": self.id,
             "day": self.day.isoformat(),
             "device_id": self.device_id,
             "total_occiput": self.total_occiput,
@@ -139,7 +179,7 @@ class DayLog:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PressureLog:
     """개별 압력 측정 로그 - 부위별 누적 시간(초) 저장"""
     id: int
@@ -155,9 +195,17 @@ class PressureLog:
     posture: PostureType = PostureType.UNKNOWN
     posture_change_required: bool = False
 
+    # to_dict용 사전 인코딩 값 (posture/created_at은 생성 후 바뀌지 않고, 매 사이클 업데이트마다 직렬화됨)
+    _posture_value: int = field(init=False, repr=False, compare=False)
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._posture_value = self.posture.value
+        self._created_at_iso = self.created_at.isoformat()
+
     @staticmethod
     def from_dict(data: dict) -> "PressureLog":
-        created_at = datetime.fromisoformat(data["created_at"])
+        created_at = _parse_datetime(data["created_at"])
         return PressureLog(
             id=int(data["id"]),
             day_id=int(data["day_id"]),
@@ -174,10 +222,15 @@ class PressureLog:
         )
 
     def to_dict(self) -> dict:
+        data = self.to_insert_dict()
+        data["id"] = self.id
+        return data
+
+    def to_insert_dict(self) -> dict:
+        """생성(insert)용 dict (id는 서버에서 생성)"""
         return {
-            "id": self.id,
             "day_id": self.day_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_iso,
             "occiput": self.occiput,
             "scapula": self.scapula,
             "relbow": self.right_elbow,
@@ -185,25 +238,17 @@ class PressureLog:
             "hip": self.hip,
             "rheel": self.right_heel,
             "lheel": self.left_heel,
-            "posture_type": self.posture.value,
+            "posture_type": self._posture_value,
             "posture_change_required": self.posture_change_required,
         }
 
     def get_duration(self, body_part: BodyPart) -> int:
         """부위별 누적 시간 반환 (초)"""
-        durations = {
-            BodyPart.OCCIPUT: self.occiput,
-            BodyPart.SCAPULA: self.scapula,
-            BodyPart.RIGHT_ELBOW: self.right_elbow,
-            BodyPart.LEFT_ELBOW: self.left_elbow,
-            BodyPart.HIP: self.hip,
-            BodyPart.RIGHT_HEEL: self.right_heel,
-            BodyPart.LEFT_HEEL: self.left_heel,
-        }
-        return durations.get(body_part, 0)
+        # 누적 시간 필드는 매 사이클 갱신되므로 테이블 대신 필드명으로 직접 조회
+        return getattr(self, _DURATION_FIELDS[body_part])
 
 
-@dataclass
+@dataclass(slots=True)
 class PostureDetectionResult:
     """자세 감지 결과 (ML 모델 추론 결과)"""
     posture_type: PostureType
@@ -216,12 +261,12 @@ class PostureDetectionResult:
     left_heel: bool = False     # 왼쪽 발뒤꿈치 압력 여부
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlPacket:
     """컨트롤 노드로 전송할 통합 패킷"""
     posture: PostureType
-    active_parts: list[str]         # 압력 받는 부위 목록 (BodyPart.value)
-    durations: dict[str, int]       # BodyPart.value -> 지속시간(초)
+    active_parts: list[str]         # 압력 받는 부위 목록 (BodyPart.key)
+    durations: dict[str, int]       # BodyPart.key -> 지속시간(초)
     controls: Optional[dict] = None  # 서버에서 받은 제어 명령 (nullable)
     activate_air: bool = False       # 에어셀 활성화 여부
 
@@ -235,7 +280,7 @@ class ControlPacket:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertMessage:
     """푸시 알림 메시지"""
     device_id: int
@@ -244,7 +289,7 @@ class AlertMessage:
     priority: str = "normal"
 
 
-@dataclass
+@dataclass(slots=True)
 class CycleResult:
     """한 사이클 처리 결과"""
     posture: PostureType
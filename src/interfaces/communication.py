@@ -81,6 +81,11 @@ class IServerClient(ABC):
         """일별 로그 업데이트"""
         pass
 
+    @abstractmethod
+    async def async_upsert_daylog(self, daylog: DayLog) -> Optional[DayLog]:
+        """일별 로그 생성 또는 업데이트 ((device_id, day) 기준)"""
+        pass
+
     @abstractmethod
     async def async_fetch_daylog_by_date(
         self, device_id: int, day: str
@@ -122,8 +127,15 @@ class IServerClient(ABC):
         pass
 
 
+class ControlNodeConnectionError(ConnectionError):
+    """컨트롤 노드 연결 오류 (시리얼 연결 오류와 구분해서 재연결하기 위해 사용)"""
+
+
 class IControlNodeSender(ABC):
-    """컨트롤 노드 통신 인터페이스 (c)"""
+    """컨트롤 노드 통신 인터페이스 (c)
+
+    send_packet은 연결이 없거나 끊긴 경우 ControlNodeConnectionError를 발생시킴
+    """
 
     @abstractmethod
     async def connect(self) -> None:
@@ -167,3 +179,8 @@ class INotifier(ABC):
     async def send_notification(self, message: AlertMessage) -> bool:
         """푸시 알림 전송"""
         pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """종료 - 백그라운드 전송 태스크와 스레드 정리"""
+        pass
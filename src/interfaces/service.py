@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import Mapping, Optional
 import numpy as np
 
 from domain.models import (
@@ -45,8 +46,13 @@ class ILogManager(ABC):
         pass
 
     @abstractmethod
-    def get_durations(self) -> dict[BodyPart, int]:
-        """부위별 압력 지속 시간 반환 (초)"""
+    def get_durations(self) -> Mapping[BodyPart, int]:
+        """부위별 압력 지속 시간 반환 (초, 읽기 전용)"""
+        pass
+
+    @abstractmethod
+    def get_durations_copy(self) -> dict[BodyPart, int]:
+        """부위별 압력 지속 시간 스냅샷 반환 (초)"""
         pass
 
     @abstractmethod
@@ -61,8 +67,9 @@ class ILogManager(ABC):
         active_parts: list[BodyPart],
         posture: PostureType,
         posture_change_required: bool,
+        created_at: Optional[datetime] = None,
     ) -> PressureLog:
-        """PressureLog 생성"""
+        """PressureLog 생성 (created_at이 없으면 현재 시각)"""
         pass
 
     @abstractmethod
@@ -78,7 +85,7 @@ class IAlertChecker(ABC):
     def check(
         self,
         patient: Patient,
-        durations: dict[BodyPart, int],
+        durations: Mapping[BodyPart, int],
     ) -> Optional[AlertMessage]:
         """임계값 초과 시 알림 메시지 반환"""
         pass
@@ -87,7 +94,7 @@ class IAlertChecker(ABC):
     def check_posture_change_required(
         self,
         patient: Patient,
-        durations: dict[BodyPart, int],
+        durations: Mapping[BodyPart, int],
     ) -> bool:
         """자세 변경 필요 여부 확인"""
         pass
@@ -106,6 +113,11 @@ class IServiceFacade(ABC):
         """한 사이클 처리 후 결과 반환"""
         pass
 
+    @abstractmethod
+    async def close(self) -> None:
+        """종료 - 진행 중인 백그라운드 전송 완료 대기"""
+        pass
+
     @abstractmethod
     def get_patient(self) -> Optional[Patient]:
         """환자 정보 조회"""
@@ -2,67 +2,121 @@ import argparse
 import asyncio
 import signal
 import sys
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from config.settings import Settings
-from container import create_container
+
+
+# 재연결 지수 백오프 (초)
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
 
 
 class TUILogHandler(logging.Handler):
     """TUI에 로그를 표시하는 핸들러"""
 
-    def __init__(self, display):
+    # 로그 레벨 -> 표시 스타일
+    LEVEL_STYLES = {
+        logging.CRITICAL: "red",
+        logging.ERROR: "red",
+        logging.WARNING: "yellow",
+        logging.INFO: "green",
+        logging.DEBUG: "",
+    }
+
+    def __init__(self, display, loop: asyncio.AbstractEventLoop):
         super().__init__()
         self._display = display
+        self._loop = loop
 
     def emit(self, record):
         try:
             msg = self.format(record)
-            style = ""
-            if record.levelno >= logging.ERROR:
-                style = "red"
-            elif record.levelno >= logging.WARNING:
-                style = "yellow"
-            elif record.levelno >= logging.INFO:
-                style = "green"
-            self._display.add_log(msg, style)
+            style = self.LEVEL_STYLES.get(record.levelno)
+            if style is None:
+                style = self._style_for_custom_level(record.levelno)
+            # rich 화면 갱신은 이벤트 루프 스레드에서만 수행
+            self._loop.call_soon_threadsafe(self._display.add_log, msg, style)
         except Exception:
             pass
 
+    @staticmethod
+    def _style_for_custom_level(levelno: int) -> str:
+        """표준 레벨이 아닌 경우 가장 가까운 하위 표준 레벨의 스타일 사용"""
+        if levelno >= logging.ERROR:
+            return "red"
+        if levelno >= logging.WARNING:
+            return "yellow"
+        if levelno >= logging.INFO:
+            return "green"
+        return ""
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler.prepare()는 enqueue 시점(이벤트 루프 스레드)에 메시지를 포맷하므로,
+    포맷을 QueueListener 스레드의 TUILogHandler로 미룬다. 같은 프로세스 안에서만 쓰므로
+    레코드를 피클 가능하게 정리할 필요가 없다.
+    """
+
+    def prepare(self, record):
+        return record
+
 
 class Application:
     """메인 애플리케이션"""
 
     def __init__(self, settings: Settings):
+        # rich/numpy/supabase 등 무거운 의존성은 실제 실행 시점에 로드 (--help, 설정 오류 시 빠르게 종료)
+        from container import create_container
+
         self._settings = settings
         self._container = create_container(settings)
         self._running = False
         self._logger = logging.getLogger("application")
         self._test_mode = settings.test_mode
 
+        # 연결 상태 이벤트 (재연결 태스크와 메인 루프가 폴링 없이 대기)
+        self._serial_connected = False
+        self._control_connected = False
+        self._serial_ready = asyncio.Event()
+        self._serial_lost = asyncio.Event()
+        self._control_lost = asyncio.Event()
+        self._reconnect_tasks: list[asyncio.Task] = []
+        self._log_listener: QueueListener | None = None
+
     def _setup_logging(self) -> None:
         """TUI용 로깅 설정"""
         # 기존 핸들러 제거
         root_logger = logging.getLogger()
         root_logger.handlers.clear()
 
-        # TUI 로그 핸들러 추가
-        tui_handler = TUILogHandler(self._container.display)
+        # TUI 로그 핸들러 추가 (로그 포맷/전달은 QueueListener 스레드에서 처리)
+        tui_handler = TUILogHandler(self._container.display, asyncio.get_running_loop())
         tui_handler.setFormatter(
             logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
         )
-        root_logger.addHandler(tui_handler)
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(_DeferredQueueHandler(log_queue))
         root_logger.setLevel(logging.INFO)
 
+        self._log_listener = QueueListener(log_queue, tui_handler)
+        self._log_listener.start()
+
     async def _connect_serial_with_retry(self) -> bool:
         """시리얼 포트 연결 시도 (재시도 로직 포함)"""
         try:
             self._container.serial_reader.connect()
             self._serial_connected = True
+            self._serial_ready.set()
             self._logger.info("시리얼 포트 연결 성공")
             return True
         except Exception as e:
             self._serial_connected = False
+            self._serial_ready.clear()
             self._logger.warning(f"시리얼 포트 연결 실패: {e}")
             return False
 
@@ -70,16 +124,57 @@ class Application:
         """컨트롤 노드 연결 시도 (재시도 로직 포함)"""
         try:
             await self._container.control_sender.connect()
-            self._control_connected = True
             self._logger.info("컨트롤 노드 연결 성공")
+            # 컨트롤 노드 연결 성공 시 센서 데이터 수신 시작
+            await self._container.control_sender.start_listening()
+            self._logger.info("센서 데이터 수신 대기 시작")
+            self._control_connected = True
             return True
         except Exception as e:
             self._control_connected = False
             self._logger.warning(f"컨트롤 노드 연결 실패: {e}")
             return False
 
+    def _show_connection_status(self) -> None:
+        """연결 상태 표시 갱신"""
+        self._container.display.show_connection_status(
+            serial_connected=self._serial_connected,
+            control_connected=self._control_connected
+        )
+
+    def _mark_serial_lost(self) -> None:
+        """시리얼 연결 끊김 처리 (재연결 태스크 깨움)"""
+        self._serial_connected = False
+        self._serial_ready.clear()
+        self._serial_lost.set()
+        self._show_connection_status()
+
+    def _mark_control_lost(self) -> None:
+        """컨트롤 노드 연결 끊김 처리 (재연결 태스크 깨움)"""
+        self._control_connected = False
+        self._control_lost.set()
+        self._show_connection_status()
+
+    async def _reconnect_loop(self, name: str, connect, lost: asyncio.Event) -> None:
+        """연결 끊김 이벤트를 기다렸다가 지수 백오프로 재연결 시도 (첫 시도 전에도 대기)"""
+        while self._running:
+            await lost.wait()
+            delay = RECONNECT_INITIAL_DELAY
+            while self._running:
+                await asyncio.sleep(delay)
+                if not self._running:
+                    break
+                self._logger.info(f"{name} 재연결 시도 중...")
+                if await connect():
+                    break
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            lost.clear()
+            self._show_connection_status()
+
     async def start(self) -> None:
         """애플리케이션 시작"""
+        from interfaces.communication import ControlNodeConnectionError
+
         self._running = True
         self._serial_connected = False
         self._control_connected = False
@@ -102,10 +197,18 @@ class Application:
 
             self._container.service_facade.set_sensor_data_callback(on_sensor_data)
 
+            # 자세 감지 모델은 서버 초기화와 겹쳐서 백그라운드 스레드에서 미리 로드
+            from service.detection import prewarm
+
+            prewarm_task = asyncio.create_task(asyncio.to_thread(prewarm))
+
             # 초기화
             self._logger.info("애플리케이션 초기화 중...")
             await self._container.service_facade.initialize()
 
+            if not await prewarm_task:
+                self._logger.warning("자세 감지 모델 사전 로드 실패")
+
             # 환자 정보 표시
             patient = self._container.service_facade.get_patient()
             device_id = self._container.service_facade.get_device_id()
@@ -114,86 +217,78 @@ class Application:
             if not patient:
                 self._logger.warning(f"디바이스 {device_id}에 등록된 환자 없음")
 
-            # 초기 연결 시도
+            # 초기 연결 시도 (실패한 연결은 재연결 태스크가 백그라운드에서 처리)
             self._logger.info("시리얼 포트 연결 중...")
-            await self._connect_serial_with_retry()
+            if not await self._connect_serial_with_retry():
+                self._serial_lost.set()
 
             self._logger.info("컨트롤 노드 연결 중...")
-            await self._connect_control_with_retry()
-
-            # 컨트롤 노드 연결 성공 시 센서 데이터 수신 시작
-            if self._control_connected:
-                await self._container.control_sender.start_listening()
-                self._logger.info("센서 데이터 수신 대기 시작")
+            if not await self._connect_control_with_retry():
+                self._control_lost.set()
+
+            self._reconnect_tasks = [
+                asyncio.create_task(
+                    self._reconnect_loop("시리얼 포트", self._connect_serial_with_retry, self._serial_lost)
+                ),
+                asyncio.create_task(
+                    self._reconnect_loop("컨트롤 노드", self._connect_control_with_retry, self._control_lost)
+                ),
+            ]
 
             # 초기 연결 상태 표시
-            self._container.display.show_connection_status(
-                serial_connected=self._serial_connected,
-                control_connected=self._control_connected
-            )
+            self._show_connection_status()
 
             self._logger.info("모니터링 시작")
 
-            # 메인 루프
-            retry_interval = 5.0  # 재연결 시도 간격 (초)
-            last_retry_time = 0.0
+            # 메인 루프 (반복마다 참조하는 객체는 지역 변수로 고정)
+            display = self._container.display
+            facade = self._container.service_facade
+            serial_ready = self._serial_ready
+            cycle_interval = self._settings.cycle_interval
+            sleep = asyncio.sleep
 
             while self._running:
-                current_time = asyncio.get_event_loop().time()
-
-                # 연결되지 않은 경우 주기적으로 재연결 시도
-                if current_time - last_retry_time >= retry_interval:
-                    if not self._serial_connected:
-                        self._logger.info("시리얼 포트 재연결 시도 중...")
-                        await self._connect_serial_with_retry()
-
-                    if not self._control_connected:
-                        self._logger.info("컨트롤 노드 재연결 시도 중...")
-                        await self._connect_control_with_retry()
-                        # 재연결 성공 시 센서 데이터 수신 시작
-                        if self._control_connected:
-                            await self._container.control_sender.start_listening()
-                            self._logger.info("센서 데이터 수신 대기 시작")
-
-                    last_retry_time = current_time
-
-                # 연결 상태 업데이트
-                self._container.display.show_connection_status(
-                    serial_connected=self._serial_connected,
-                    control_connected=self._control_connected
-                )
-
-                # 시리얼이 연결되지 않은 경우 대기
+                # 시리얼이 연결되지 않은 경우 재연결될 때까지 대기
                 if not self._serial_connected:
-                    await asyncio.sleep(1.0)
+                    await serial_ready.wait()
                     continue
 
                 try:
-                    result = await self._container.service_facade.process_cycle()
-                    self._container.display.show_cycle_result(result)
-                    await asyncio.sleep(self._settings.cycle_interval)
+                    result = await facade.process_cycle()
+                    display.show_cycle_result(result)
+                    await sleep(cycle_interval)
+                except ControlNodeConnectionError as e:
+                    # 컨트롤 노드 연결 오류는 컨트롤 노드 재연결 태스크에 알림
+                    self._mark_control_lost()
+                    display.show_error(e)
+                    self._logger.error(f"컨트롤 노드 연결 오류: {e}")
+                    await sleep(1.0)
                 except (ConnectionError, OSError) as e:
-                    # 연결 관련 오류 발생 시 연결 상태 리셋
-                    self._serial_connected = False
-                    self._container.display.show_error(e)
+                    # 그 외 연결 관련 오류는 시리얼 재연결 태스크에 알림
+                    self._mark_serial_lost()
+                    display.show_error(e)
                     self._logger.error(f"연결 오류: {e}")
-                    await asyncio.sleep(1.0)
+                    await sleep(1.0)
                 except Exception as e:
-                    self._container.display.show_error(e)
+                    display.show_error(e)
                     self._logger.error(f"사이클 오류: {e}")
-                    await asyncio.sleep(1.0)
+                    await sleep(1.0)
 
         except Exception as e:
             self._logger.error(f"애플리케이션 오류: {e}")
             self._container.display.show_error(e)
             raise
         finally:
+            for task in self._reconnect_tasks:
+                task.cancel()
+            self._reconnect_tasks = []
             self._container.display.stop_live()
 
     async def stop(self) -> None:
         """애플리케이션 종료"""
         self._logger.info("애플리케이션 종료 중...")
         self._running = False
+        self._serial_ready.set()  # 시리얼 대기 중인 메인 루프 깨움
 
         # 연결 해제
         try:
@@ -206,8 +301,29 @@ class Application:
         except Exception as e:
             self._logger.error(f"컨트롤 노드 연결 해제 오류: {e}")
 
+        try:
+            await self._container.service_facade.close()
+        except Exception as e:
+            self._logger.error(f"서비스 종료 오류: {e}")
+
+        try:
+            await self._container.notifier.close()
+        except Exception as e:
+            self._logger.error(f"알림 전송 종료 오류: {e}")
+
+        try:
+            await self._container.server_client.close()
+        except Exception as e:
+            self._logger.error(f"서버 연결 해제 오류: {e}")
+
         self._logger.info("애플리케이션 종료 완료")
 
+    def stop_logging(self) -> None:
+        """로그 큐 리스너 종료 (종료 처리 로그까지 모두 전달한 뒤 main에서 호출)"""
+        if self._log_listener:
+            self._log_listener.stop()  # 큐에 남은 레코드를 모두 처리한 뒤 스레드 종료
+            self._log_listener = None
+
 
 def parse_args() -> argparse.Namespace:
     """CLI 인자 파싱"""
@@ -254,13 +370,25 @@ def main() -> None:
 
     app = Application(settings)
 
-    # 이벤트 루프 설정
+    # 이벤트 루프 설정 (Linux 등에서는 uvloop 사용, 미설치 시 기본 루프)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    # 시그널 핸들러 설정
+    # 시그널 핸들러 설정 (종료 태스크는 loop.close() 전에 끝까지 실행하도록 참조 유지)
+    stop_task: asyncio.Task | None = None
+
     def signal_handler():
-        loop.create_task(app.stop())
+        nonlocal stop_task
+        if stop_task is None:
+            stop_task = loop.create_task(app.stop())
 
     try:
         loop.add_signal_handler(signal.SIGINT, signal_handler)
@@ -274,6 +402,12 @@ def main() -> None:
     except KeyboardInterrupt:
         loop.run_until_complete(app.stop())
     finally:
+        # start()는 종료 신호 직후 반환되므로, 시그널로 시작된 stop()이 끝날 때까지 실행
+        if stop_task is not None:
+            loop.run_until_complete(stop_task)
+        # 종료 처리 로그까지 전달한 뒤 리스너를 멈추고, 핸들러가 예약한 화면 갱신 콜백을 실행
+        app.stop_logging()
+        loop.run_until_complete(asyncio.sleep(0))
         loop.close()
 
 
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 from collections import deque
 
@@ -13,6 +14,13 @@ from domain.models import CycleResult, Patient, ControlPacket
 from domain.enums import PostureType, BodyPart
 
 
+def _names_by_value(names: dict, enum_type, default: str) -> tuple[str, ...]:
+    """enum 값(0부터 연속)을 인덱스로 하는 이름 튜플 생성"""
+    values = [member.value for member in enum_type]
+    assert values == list(range(len(values))), f"{enum_type.__name__} 값이 0부터 연속이어야 합니다"
+    return tuple(names.get(member, default) for member in enum_type)
+
+
 class ConsoleDisplay(IDisplay):
     """TUI 기반 콘솔 출력 구현체 (rich.live 사용)"""
 
@@ -37,10 +45,20 @@ class ConsoleDisplay(IDisplay):
         BodyPart.LEFT_HEEL: "왼쪽 발뒤꿈치",
     }
 
+    # enum 값으로 바로 인덱싱하는 이름 테이블
+    POSTURE_NAME_BY_VALUE = _names_by_value(POSTURE_NAMES, PostureType, "미확인")
+    BODY_PART_NAME_BY_VALUE = _names_by_value(BODY_PART_NAMES, BodyPart, "")
+
     MAX_LOG_LINES = 10
+    MIN_REFRESH_INTERVAL = 0.25  # 화면 출력 최소 간격 (초당 최대 4회)
+
+    # 자주 표시되는 구간(0~2시간)의 분:초 문자열 미리 생성
+    DURATION_STR_LIMIT = 7200
+    DURATION_STRS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(DURATION_STR_LIMIT + 1))
 
     def __init__(self):
-        self._console = Console()
+        # 스타일은 코드에서 직접 지정하므로 마크업/하이라이트/이모지 파싱 비활성화
+        self._console = Console(markup=False, highlight=False, emoji=False)
         self._live: Optional[Live] = None
         self._patient: Optional[Patient] = None
         self._device_id: int = 0
@@ -51,13 +69,27 @@ class ConsoleDisplay(IDisplay):
         self._control_connected: bool = False
         self._test_mode: bool = False
         self._last_sensor_data: Optional[dict] = None
+        self._patient_table_cache: Optional[Table] = None
+        self._connection_panel_cache: Optional[Panel] = None
+        self._body_part_rows = [
+            (body_part, self.BODY_PART_NAME_BY_VALUE[body_part] or body_part.key) for body_part in BodyPart
+        ]
+
+        # 레이아웃 골격은 한 번만 구성하고, 갱신 시 변경된 영역만 교체
+        self._layout = self._create_layout()
+        self._header_panels = {enabled: self._build_header(enabled) for enabled in (False, True)}
+        self._dirty: set[str] = {"header", "left", "right", "footer"}
+        self._flush_scheduled = False
+        self._last_render_time = 0.0
 
     def start_live(self) -> None:
         """Live 디스플레이 시작"""
+        self._update_dirty_regions()
         self._live = Live(
-            self._build_layout(),
+            self._layout,
             console=self._console,
-            refresh_per_second=4,
+            auto_refresh=False,  # 변경이 있을 때만 _flush에서 직접 출력
+            vertical_overflow="crop",
             screen=True,
         )
         self._live.start()
@@ -71,15 +103,44 @@ class ConsoleDisplay(IDisplay):
     def add_log(self, message: str, style: str = "") -> None:
         """로그 메시지 추가"""
         self._log_messages.append((message, style))
-        self._refresh()
+        self._refresh("footer")
+
+    def _refresh(self, *regions: str) -> None:
+        """화면 갱신 예약 (여러 갱신을 모아 최소 간격마다 한 번만 출력)"""
+        self._dirty.update(regions)
+        if not self._live or self._flush_scheduled:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서 호출된 경우 즉시 반영
+            self._render()
+            return
+
+        self._flush_scheduled = True
+        delay = self._last_render_time + self.MIN_REFRESH_INTERVAL - loop.time()
+        if delay > 0:
+            loop.call_later(delay, self._flush)
+        else:
+            loop.call_soon(self._flush)
 
-    def _refresh(self) -> None:
-        """화면 갱신"""
+    def _flush(self) -> None:
+        """예약된 갱신 출력"""
+        self._flush_scheduled = False
         if self._live:
-            self._live.update(self._build_layout())
-
-    def _build_layout(self) -> Layout:
-        """전체 레이아웃 구성"""
+            self._last_render_time = asyncio.get_running_loop().time()
+            self._render()
+
+    def _render(self) -> None:
+        """변경된 영역을 다시 구성하고 화면 출력"""
+        if not self._dirty:
+            return
+        self._update_dirty_regions()
+        self._live.refresh()
+
+    def _create_layout(self) -> Layout:
+        """전체 레이아웃 골격 구성"""
         layout = Layout()
 
         layout.split_column(
@@ -93,39 +154,49 @@ class ConsoleDisplay(IDisplay):
             Layout(name="right"),
         )
 
-        # 헤더: 타이틀 (테스트 모드 표시 포함)
-        header_text = Text()
-        if self._test_mode:
-            header_text.append("[TEST MODE] ", style="bold yellow on red")
-        header_text.append("베드솔루션 모니터링 시스템", style="bold white")
-        if self._test_mode:
-            header_text.append(" [TEST MODE]", style="bold yellow on red")
+        return layout
 
-        header_border = "red" if self._test_mode else "blue"
-        layout["header"].update(
-            Panel(
-                header_text,
-                border_style=header_border,
-                title="[bold yellow]테스트 모드[/bold yellow]" if self._test_mode else None,
-            )
-        )
+    def _update_dirty_regions(self) -> None:
+        """변경 표시된 영역의 패널만 다시 구성"""
+        dirty = self._dirty
+        if not dirty:
+            return
+
+        # 헤더: 타이틀 (테스트 모드 여부에 따라 미리 만든 패널 사용)
+        if "header" in dirty:
+            self._layout["header"].update(self._header_panels[self._test_mode])
 
         # 왼쪽: 환자 정보 + 현재 상태
-        layout["left"].update(self._build_left_panel())
+        if "left" in dirty:
+            self._layout["left"].update(self._build_left_panel())
 
         # 오른쪽: 압력 정보 + 제어 신호
-        layout["right"].update(self._build_right_panel())
+        if "right" in dirty:
+            self._layout["right"].update(self._build_right_panel())
 
         # 푸터: 로그
-        layout["footer"].update(self._build_log_panel())
+        if "footer" in dirty:
+            self._layout["footer"].update(self._build_log_panel())
 
-        return layout
+        dirty.clear()
 
-    def _build_left_panel(self) -> Panel:
-        """왼쪽 패널 (환자 정보 + 현재 상태)"""
-        elements = []
+    def _build_header(self, test_mode: bool) -> Panel:
+        """헤더 패널 (테스트 모드 표시 포함)"""
+        header_text = Text()
+        if test_mode:
+            header_text.append("[TEST MODE] ", style="bold yellow on red")
+        header_text.append("베드솔루션 모니터링 시스템", style="bold white")
+        if test_mode:
+            header_text.append(" [TEST MODE]", style="bold yellow on red")
+
+        return Panel(
+            header_text,
+            border_style="red" if test_mode else "blue",
+            title=Text("테스트 모드", style="bold yellow") if test_mode else None,
+        )
 
-        # 환자 정보 테이블
+    def _build_patient_table(self) -> Table:
+        """디바이스/환자 정보 테이블"""
         patient_table = Table(title="디바이스/환자 정보", expand=True)
         patient_table.add_column("항목", style="cyan")
         patient_table.add_column("값")
@@ -142,11 +213,12 @@ class ConsoleDisplay(IDisplay):
             patient_table.add_row("오른발뒤꿈치", f"{self._patient.right_heel_threshold}분")
             patient_table.add_row("왼발뒤꿈치", f"{self._patient.left_heel_threshold}분")
         else:
-            patient_table.add_row("환자", "[yellow]미등록[/yellow]")
+            patient_table.add_row("환자", Text("미등록", style="yellow"))
 
-        elements.append(patient_table)
+        return patient_table
 
-        # 연결 상태
+    def _build_connection_panel(self) -> Panel:
+        """연결 상태 패널"""
         conn_text = Text()
         serial_status = "연결됨" if self._serial_connected else "연결 안됨"
         serial_style = "green" if self._serial_connected else "red"
@@ -158,7 +230,21 @@ class ConsoleDisplay(IDisplay):
         conn_text.append("컨트롤: ", style="cyan")
         conn_text.append(control_status, style=control_style)
 
-        elements.append(Panel(conn_text, title="연결 상태", border_style="blue"))
+        return Panel(conn_text, title="연결 상태", border_style="blue")
+
+    def _build_left_panel(self) -> Panel:
+        """왼쪽 패널 (환자 정보 + 현재 상태)"""
+        elements = []
+
+        # 환자 정보 테이블 (환자 정보 변경 시에만 다시 구성)
+        if self._patient_table_cache is None:
+            self._patient_table_cache = self._build_patient_table()
+        elements.append(self._patient_table_cache)
+
+        # 연결 상태 (연결 상태 변경 시에만 다시 구성)
+        if self._connection_panel_cache is None:
+            self._connection_panel_cache = self._build_connection_panel()
+        elements.append(self._connection_panel_cache)
 
         # 알림 상태
         if self._last_result:
@@ -174,18 +260,17 @@ class ConsoleDisplay(IDisplay):
 
         # 에러 표시
         if self._last_error:
-            elements.append(
-                Panel(
-                    f"[bold red]{type(self._last_error).__name__}[/bold red]\n{self._last_error}",
-                    title="오류",
-                    border_style="red",
-                )
-            )
+            error_text = Text()
+            error_text.append(type(self._last_error).__name__, style="bold red")
+            error_text.append(f"\n{self._last_error}")
+            elements.append(Panel(error_text, title="오류", border_style="red"))
 
         return Panel(Group(*elements), title="정보", border_style="blue")
 
     def _format_duration(self, seconds: int) -> str:
         """초를 분:초 형식으로 변환"""
+        if 0 <= seconds <= self.DURATION_STR_LIMIT:
+            return self.DURATION_STRS[seconds]
         minutes = seconds // 60
         secs = seconds % 60
         return f"{minutes:02d}:{secs:02d}"
@@ -196,7 +281,7 @@ class ConsoleDisplay(IDisplay):
 
         # 현재 자세 표시
         if self._last_result:
-            posture_name = self.POSTURE_NAMES.get(self._last_result.posture, "미확인")
+            posture_name = self.POSTURE_NAME_BY_VALUE[self._last_result.posture.value]
             posture_style = "bold cyan"
             if self._last_result.posture_change_required:
                 posture_style = "bold red"
@@ -206,7 +291,7 @@ class ConsoleDisplay(IDisplay):
                 posture_text.append(" (변경 필요)", style="bold red")
             elements.append(Panel(posture_text, title="현재 자세", border_style="cyan"))
         else:
-            elements.append(Panel("[dim]대기 중...[/dim]", title="현재 자세", border_style="dim"))
+            elements.append(Panel(Text("대기 중...", style="dim"), title="현재 자세", border_style="dim"))
 
         # 압력 지속 시간 테이블
         duration_table = Table(title="압력 지속 시간", expand=True)
@@ -214,16 +299,15 @@ class ConsoleDisplay(IDisplay):
         duration_table.add_column("지속 시간", justify="right")
 
         if self._last_result and self._last_result.durations:
-            for body_part in BodyPart:
-                part_name = self.BODY_PART_NAMES.get(body_part, body_part.value)
-                duration = self._last_result.durations.get(body_part, 0)
+            durations = self._last_result.durations
+            for body_part, part_name in self._body_part_rows:
+                duration = durations.get(body_part, 0)
                 duration_str = self._format_duration(duration)
                 # 2분 이상이면 경고 색상
                 style = "bold red" if duration >= 120 else ("yellow" if duration >= 60 else "")
                 duration_table.add_row(part_name, duration_str, style=style)
         else:
-            for body_part in BodyPart:
-                part_name = self.BODY_PART_NAMES.get(body_part, body_part.value)
+            for _, part_name in self._body_part_rows:
                 duration_table.add_row(part_name, "--:--")
 
         elements.append(duration_table)
@@ -238,7 +322,7 @@ class ConsoleDisplay(IDisplay):
             for key, value in controls.items():
                 control_table.add_row(str(key), str(value))
         else:
-            control_table.add_row("-", "[dim]없음[/dim]")
+            control_table.add_row("-", Text("없음", style="dim"))
 
         elements.append(control_table)
 
@@ -261,7 +345,7 @@ class ConsoleDisplay(IDisplay):
             if self._last_sensor_data.get("mock"):
                 sensor_text.append("\n[테스트 데이터]", style="yellow")
         else:
-            sensor_text.append("[dim]수신 대기 중...[/dim]")
+            sensor_text.append("수신 대기 중...", style="dim")
 
         elements.append(Panel(sensor_text, title="컨트롤 노드 센서", border_style="magenta"))
 
@@ -274,7 +358,7 @@ class ConsoleDisplay(IDisplay):
             log_text.append(f"{msg}\n", style=style)
 
         if not self._log_messages:
-            log_text.append("[dim]로그가 없습니다[/dim]")
+            log_text.append("로그가 없습니다", style="dim")
 
         return Panel(log_text, title="로그", border_style="dim")
 
@@ -282,8 +366,10 @@ class ConsoleDisplay(IDisplay):
         """사이클 처리 결과 표시"""
         self._last_result = result
         self._last_error = None
-        self._serial_connected = True  # 결과가 오면 시리얼은 연결된 상태
-        self._refresh()
+        if not self._serial_connected:
+            self._serial_connected = True  # 결과가 오면 시리얼은 연결된 상태
+            self._connection_panel_cache = None
+        self._refresh("left", "right")
 
     def show_control_packet(self, packet: ControlPacket) -> None:
         """제어 패킷 표시 (결과에 포함되어 있어 별도 처리 불필요)"""
@@ -293,26 +379,28 @@ class ConsoleDisplay(IDisplay):
         """환자 정보 저장"""
         self._patient = patient
         self._device_id = device_id
-        self._refresh()
+        self._patient_table_cache = None
+        self._refresh("left")
 
     def show_error(self, error: Exception) -> None:
         """에러 표시"""
         self._last_error = error
+        self._dirty.add("left")
         self.add_log(f"[오류] {type(error).__name__}: {error}", "red")
-        self._refresh()
 
     def show_connection_status(self, serial_connected: bool, control_connected: bool) -> None:
         """연결 상태 업데이트"""
         self._serial_connected = serial_connected
         self._control_connected = control_connected
-        self._refresh()
+        self._connection_panel_cache = None
+        self._refresh("left")
 
     def set_test_mode(self, enabled: bool) -> None:
         """테스트 모드 설정"""
         self._test_mode = enabled
-        self._refresh()
+        self._refresh("header")
 
     def show_sensor_data(self, sensor_data: dict) -> None:
         """컨트롤 노드에서 수신한 센서 데이터 표시"""
         self._last_sensor_data = sensor_data
-        self._refresh()
+        self._refresh("right")
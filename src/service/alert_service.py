@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Mapping, Optional
 
 from interfaces.service import IAlertChecker
 from domain.models import Patient, AlertMessage
@@ -22,19 +22,16 @@ class AlertChecker(IAlertChecker):
     def check(
         self,
         patient: Patient,
-        durations: dict[BodyPart, int],
+        durations: Mapping[BodyPart, int],
     ) -> Optional[AlertMessage]:
         """임계값 초과 시 알림 메시지 반환"""
-        alert_parts = []
-
-        for body_part, duration_seconds in durations.items():
-            # 환자별 임계값 (분 단위) -> 초 단위로 변환
-            threshold_seconds = patient.get_threshold(body_part) * 60
-
-            if duration_seconds >= threshold_seconds:
-                part_name = self.BODY_PART_NAMES.get(body_part, body_part.value)
-                duration_minutes = duration_seconds // 60
-                alert_parts.append(f"{part_name} ({duration_minutes}분)")
+        # 환자별 임계값 (초 단위, 환자 생성 시 미리 변환)
+        thresholds = patient.thresholds_seconds
+        alert_parts = [
+            f"{self.BODY_PART_NAMES.get(body_part, body_part.key)} ({duration_seconds // 60}분)"
+            for body_part, duration_seconds in durations.items()
+            if duration_seconds >= thresholds[body_part]
+        ]
 
         if not alert_parts:
             return None
@@ -49,14 +46,12 @@ class AlertChecker(IAlertChecker):
     def check_posture_change_required(
         self,
         patient: Patient,
-        durations: dict[BodyPart, int],
+        durations: Mapping[BodyPart, int],
     ) -> bool:
         """자세 변경 필요 여부 확인"""
-        for body_part, duration_seconds in durations.items():
-            # 환자별 임계값 (분 단위) -> 초 단위로 변환
-            threshold_seconds = patient.get_threshold(body_part) * 60
-
-            if duration_seconds >= threshold_seconds:
-                return True
-
-        return False
+        # 환자별 임계값 (초 단위, 환자 생성 시 미리 변환)
+        thresholds = patient.thresholds_seconds
+        return any(
+            duration_seconds >= thresholds[body_part]
+            for body_part, duration_seconds in durations.items()
+        )
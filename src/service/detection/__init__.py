@@ -1,3 +1,3 @@
-from .posture_detection import PostureDetectionModel
+from .posture_detection import PostureDetectionModel, prewarm
 
-__all__ = ["PostureDetectionModel"]
+__all__ = ["PostureDetectionModel", "prewarm"]
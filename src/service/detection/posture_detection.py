@@ -1,23 +1,90 @@
 import numpy as np
-from joblib import load
 from logging import getLogger
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.multioutput import MultiOutputClassifier
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import os
 
 from domain.enums import PostureType
 from domain.models import PostureDetectionResult
 
+if TYPE_CHECKING:
+    # sklearn은 import 비용이 커서 타입 힌트용으로만 가져옴
+    from sklearn.preprocessing import MinMaxScaler
+    from sklearn.multioutput import MultiOutputClassifier
+
+
+# (14, 7) 히트맵을 펼친 배열에서 피처 벡터로 가져올 인덱스
+# head: 0~1행의 0,3,6열 (6개), body: 2~13행 전체 (84개)
+_FEATURE_INDEX = np.array([0, 3, 6, 7, 10, 13, *range(2 * 7, 14 * 7)], dtype=np.intp)
+
+
+def _handle_supine(result: PostureDetectionResult, upper_body, right_leg, left_leg, feet) -> None:
+    """정자세"""
+    result.posture_type = PostureType.SUPINE
+    result.occiput = True
+    result.scapula = True
+    result.hip = True
+    result.left_heel = True
+    result.right_heel = True
+    result.left_elbow = True
+    result.right_elbow = True
+    if left_leg:
+        result.right_heel = False
+        result.posture_type = PostureType.SUPINE_RIGHT
+    if right_leg:
+        result.left_heel = False
+        result.posture_type = PostureType.SUPINE_LEFT
+
+
+def _handle_left_side(result: PostureDetectionResult, upper_body, right_leg, left_leg, feet) -> None:
+    """측면왼"""
+    result.posture_type = PostureType.LEFT_SIDE
+    result.left_elbow = True
+    result.left_heel = True
+
+
+def _handle_right_side(result: PostureDetectionResult, upper_body, right_leg, left_leg, feet) -> None:
+    """측면오"""
+    result.posture_type = PostureType.RIGHT_SIDE
+    result.right_elbow = True
+    result.right_heel = True
+
+
+def _handle_prone(result: PostureDetectionResult, upper_body, right_leg, left_leg, feet) -> None:
+    """엎드림"""
+    result.posture_type = PostureType.PRONE
+
+
+def _handle_sitting(result: PostureDetectionResult, upper_body, right_leg, left_leg, feet) -> None:
+    """앉음"""
+    result.posture_type = PostureType.SITTING
+    result.hip = True
+
+
+# 모델 자세 라벨 -> 결과 설정 함수 (없는 라벨은 UNKNOWN 유지)
+_POSTURE_HANDLERS = {
+    0: _handle_supine,
+    1: _handle_left_side,
+    2: _handle_right_side,
+    3: _handle_prone,
+    5: _handle_sitting,
+}
+
 
 class PostureDetectionModel:
     """ML 모델을 사용한 자세 감지"""
 
-    _scaler: Optional[MinMaxScaler] = None
-    _predictor: Optional[MultiOutputClassifier] = None
+    _scaler: Optional["MinMaxScaler"] = None
+    _predictor: Optional["MultiOutputClassifier"] = None
+
+    # 단일 샘플 추론용으로 풀어 둔 scaler 파라미터와 출력별 estimator
+    _scale: Optional[np.ndarray] = None
+    _min: Optional[np.ndarray] = None
+    _clip_range: Optional[tuple[float, float]] = None
+    _estimators: tuple = ()
 
     def __init__(self):
         self._logger = getLogger("PostureDetectionModel")
+        self._feature_buf = np.empty((1, len(_FEATURE_INDEX)), dtype=np.float32)
 
     def _load_models(self) -> bool:
         """모델 파일 로드 (싱글톤 패턴으로 한 번만 로드)"""
@@ -32,8 +99,21 @@ class PostureDetectionModel:
             self._logger.error(f"Model files not found: {model_dir}")
             return False
 
-        PostureDetectionModel._scaler = load(scaler_path)
-        PostureDetectionModel._predictor = load(predictor_path)
+        # joblib(및 pickle 복원 시 끌려오는 sklearn)은 모델을 처음 로드할 때 import
+        from joblib import load
+
+        scaler = load(scaler_path)
+        predictor = load(predictor_path)
+
+        # MinMaxScaler.transform == X * scale_ + min_ (clip=True면 feature_range로 자름)
+        PostureDetectionModel._scale = np.asarray(scaler.scale_, dtype=np.float64)
+        PostureDetectionModel._min = np.asarray(scaler.min_, dtype=np.float64)
+        PostureDetectionModel._clip_range = tuple(scaler.feature_range) if getattr(scaler, "clip", False) else None
+        # MultiOutputClassifier.predict는 출력마다 joblib Parallel로 estimator를 호출하므로 직접 호출
+        PostureDetectionModel._estimators = tuple(predictor.estimators_)
+
+        PostureDetectionModel._scaler = scaler
+        PostureDetectionModel._predictor = predictor
 
         self._logger.info("Posture detection models loaded successfully")
         return True
@@ -47,11 +127,15 @@ class PostureDetectionModel:
                 - 2~13행: body (12x7)
 
         Returns:
-            (1, 90) 형태의 피처 벡터
+            (1, 90) 형태의 피처 벡터 (재사용 버퍼, 다음 호출 시 덮어씀)
         """
-        head = heatmap[0:2, [0, 3, 6]].flatten().reshape(1, 6)  # 2x3 -> 1x6
-        body = heatmap[2:14, :].flatten().reshape(1, 84)  # 12x7 -> 1x84
-        return np.concatenate([head, body], axis=1)
+        if heatmap.shape != (14, 7):
+            raise ValueError(f"Expected heatmap shape (14, 7), got {heatmap.shape}")
+
+        # head 2x3 + body 12x7을 한 번의 gather로 미리 할당한 버퍼에 채움
+        flat = heatmap.astype(np.float32, copy=False).reshape(-1)
+        np.take(flat, _FEATURE_INDEX, out=self._feature_buf[0])
+        return self._feature_buf
 
     def detect(self, pressure_map: np.ndarray) -> PostureDetectionResult:
         """압력 맵으로부터 자세 감지"""
@@ -60,8 +144,15 @@ class PostureDetectionModel:
             return PostureDetectionResult(posture_type=PostureType.UNKNOWN)
 
         raw = self._convert(pressure_map)
-        scaled = PostureDetectionModel._scaler.transform(raw)
-        prediction = PostureDetectionModel._predictor.predict(scaled)[0]
+
+        # 단일 샘플은 sklearn 입력 검증/병렬 디스패치 비용이 추론보다 커서 직접 계산
+        # (MinMaxScaler와 동일하게 실수 입력은 원래 dtype 유지, 그 외는 float64로 변환)
+        scaled = raw.copy() if raw.dtype.kind == "f" else raw.astype(np.float64)
+        scaled *= PostureDetectionModel._scale
+        scaled += PostureDetectionModel._min
+        if PostureDetectionModel._clip_range is not None:
+            np.clip(scaled, *PostureDetectionModel._clip_range, out=scaled)
+        prediction = [estimator.predict(scaled)[0] for estimator in PostureDetectionModel._estimators]
 
         posture = prediction[0]
         risky_part_flags = prediction[1:]
@@ -74,34 +165,28 @@ class PostureDetectionModel:
 
         result = PostureDetectionResult(posture_type=PostureType.UNKNOWN)
 
-        match posture:
-            case 0:  # 정자세
-                result.posture_type = PostureType.SUPINE
-                result.occiput = True
-                result.scapula = True
-                result.hip = True
-                result.left_heel = True
-                result.right_heel = True
-                result.left_elbow = True
-                result.right_elbow = True
-                if left_leg:
-                    result.right_heel = False
-                    result.posture_type = PostureType.SUPINE_RIGHT
-                if right_leg:
-                    result.left_heel = False
-                    result.posture_type = PostureType.SUPINE_LEFT
-            case 1:  # 측면왼
-                result.posture_type = PostureType.LEFT_SIDE
-                result.left_elbow = True
-                result.left_heel = True
-            case 2:  # 측면오
-                result.posture_type = PostureType.RIGHT_SIDE
-                result.right_elbow = True
-                result.right_heel = True
-            case 3:  # 엎드림
-                result.posture_type = PostureType.PRONE
-            case 5:  # 앉음
-                result.posture_type = PostureType.SITTING
-                result.hip = True
+        handler = _POSTURE_HANDLERS.get(int(posture))
+        if handler is not None:
+            handler(result, upper_body, right_leg, left_leg, feet)
 
         return result
+
+
+def prewarm() -> bool:
+    """모델 로드와 더미 추론을 미리 수행 (첫 프레임 추론 지연 제거)
+
+    pickle 복원과 estimator별 첫 호출 비용을 시작 시점에 치르도록
+    애플리케이션 부트스트랩에서 한 번 호출
+
+    Returns:
+        모델 로드 성공 여부 (joblib/sklearn import나 모델 복원 실패 시 False)
+    """
+    model = PostureDetectionModel()
+    try:
+        if not model._load_models():
+            return False
+        model.detect(np.zeros((14, 7), dtype=np.float32))
+    except Exception as e:
+        model._logger.error("Failed to prewarm posture detection models: %s", e)
+        return False
+    return True
@@ -1,10 +1,49 @@
 import numpy as np
-from scipy.interpolate import RectBivariateSpline
 
 
 class HeatmapConverter:
     """Head와 Body 데이터를 합쳐서 Heatmap으로 변환"""
 
+    def __init__(self):
+        # (원본 shape, 목표 shape) -> 스플라인 보간 가중치 행렬
+        self._spline_weights: dict[tuple[tuple[int, int], tuple[int, int]], np.ndarray] = {}
+
+    def _get_spline_weights(
+        self, origin_shape: tuple[int, int], shape: tuple[int, int], kx: int, ky: int
+    ) -> np.ndarray:
+        """스플라인 보간 가중치 행렬 반환 (shape 조합별로 한 번만 계산)
+
+        보간(s=0) 결과는 입력 값에 대해 선형이므로, 각 단위 기저 행렬을 보간한 결과를
+        쌓아 두면 이후에는 행렬 곱 한 번으로 같은 결과를 얻을 수 있음
+
+        Returns:
+            (원본 원소 수, 목표 원소 수) 형태의 가중치 행렬
+        """
+        key = (origin_shape, shape)
+        weights = self._spline_weights.get(key)
+        if weights is not None:
+            return weights
+
+        # scipy는 import 비용이 커서 가중치를 처음 계산할 때 가져옴
+        from scipy.interpolate import RectBivariateSpline
+
+        current_rows, current_cols = origin_shape
+        target_rows, target_cols = shape
+
+        # 좌표 그리드 (0~1 정규화)
+        x_orig = np.linspace(0, 1, current_cols)
+        y_orig = np.linspace(0, 1, current_rows)
+        x_new = np.linspace(0, 1, target_cols)
+        y_new = np.linspace(0, 1, target_rows)
+
+        size = current_rows * current_cols
+        basis = np.eye(size).reshape(size, current_rows, current_cols)
+        weights = np.stack(
+            [RectBivariateSpline(y_orig, x_orig, b, kx=kx, ky=ky)(y_new, x_new).ravel() for b in basis]
+        )
+        self._spline_weights[key] = weights
+        return weights
+
     def _resize_with_interpolation(
         self, origin: np.ndarray, shape: tuple[int, int]
     ) -> np.ndarray:
@@ -40,15 +79,10 @@ class HeatmapConverter:
             kx = min(order, max(1, current_rows - 1))
             ky = min(order, max(1, current_cols - 1))
 
-            # 좌표 그리드 (0~1 정규화)
-            x_orig = np.linspace(0, 1, current_cols)
-            y_orig = np.linspace(0, 1, current_rows)
-            x_new = np.linspace(0, 1, target_cols)
-            y_new = np.linspace(0, 1, target_rows)
-
-            spline = RectBivariateSpline(y_orig, x_orig, origin, kx=kx, ky=ky)
-            resized = spline(y_new, x_new)
-            return np.asarray(resized, dtype=np.float32)
+            # 매 프레임 스플라인을 만들지 않고 미리 계산한 가중치로 보간 (head (2, 3) -> (2, 7) 등)
+            weights = self._get_spline_weights(origin.shape, (target_rows, target_cols), kx, ky)
+            resized = origin.reshape(-1) @ weights
+            return resized.reshape(target_rows, target_cols).astype(np.float32)
 
         # 폴백: 차원이 1인 경우
         result = origin
@@ -75,15 +109,18 @@ class HeatmapConverter:
 
         return result.astype(np.float32)
 
-    def convert(self, head: np.ndarray, body: np.ndarray) -> np.ndarray:
+    def convert(
+        self, head: np.ndarray, body: np.ndarray, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """Head와 Body 데이터를 합쳐서 Heatmap으로 변환
 
         Args:
             head: (2, 3) 형태의 head 데이터
             body: (12, 7) 형태의 body 데이터
+            out: 결과를 채울 (14, 7) float32 버퍼 (없으면 새 배열 할당)
 
         Returns:
-            (14, 7) 형태의 heatmap
+            (14, 7) 형태의 heatmap (out을 주면 out)
         """
         if head.ndim != 2 or body.ndim != 2:
             raise ValueError("head and body must be 2D numpy arrays")
@@ -106,6 +143,8 @@ class HeatmapConverter:
         )
 
         # 세로로 병합: (2, 7) + (12, 7) = (14, 7)
+        if out is not None:
+            return np.concatenate((head_resized, body_resized), axis=0, out=out)
         merged = np.concatenate((head_resized, body_resized), axis=0)
 
         return merged.astype(np.float32)
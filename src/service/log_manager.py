@@ -1,24 +1,47 @@
-from datetime import datetime, date
+import time
+from datetime import datetime, date, timedelta
+from types import MappingProxyType
+from typing import Mapping
 
 from interfaces.service import ILogManager
 from domain.models import DayLog, PressureLog
 from domain.enums import PostureType, BodyPart
 
 
+# 매 사이클 순회하는 부위 순서 (enum 순회 비용 없이 재사용)
+_BODY_PARTS = tuple(BodyPart)
+
+
 class LogManager(ILogManager):
     """로그 관리 구현체 (h)"""
 
     def __init__(self, device_id: int = 0):
         self._device_id = device_id
         self._durations: dict[BodyPart, int] = {part: 0 for part in BodyPart}
+        self._durations_view = MappingProxyType(self._durations)  # 복사 없는 읽기 전용 뷰
         self._current_daylog: DayLog | None = None
         self._last_posture: PostureType = PostureType.UNKNOWN
         self._cycle_interval_seconds = 1  # 측정 주기
+        # 오늘 날짜 캐시 (다음 자정이 지나야 다시 계산)
+        self._today: date = date.today()
+        self._next_day_at: float = self._midnight_after(self._today)
+
+    @staticmethod
+    def _midnight_after(day: date) -> float:
+        """해당 날짜 다음 자정의 epoch 시각 (로컬 시간)"""
+        return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+
+    def _current_day(self) -> date:
+        """오늘 날짜 반환 (자정이 지났을 때만 date.today() 재계산)"""
+        if time.time() >= self._next_day_at:
+            self._today = date.today()
+            self._next_day_at = self._midnight_after(self._today)
+        return self._today
 
     def set_device_id(self, device_id: int) -> None:
         """디바이스 ID 설정"""
         self._device_id = device_id
-        self._current_daylog = DayLog.create_empty(device_id, date.today())
+        self._current_daylog = DayLog.create_empty(device_id, self._current_day())
 
     def record(self, active_parts: list[BodyPart], posture: PostureType) -> bool:
         """압력 지속 시간 기록
@@ -34,11 +57,11 @@ class LogManager(ILogManager):
             posture_changed = True
 
         # 압력 받는 부위는 지속 시간 증가, 없는 부위는 초기화
-        for body_part in BodyPart:
-            if body_part in active_parts:
-                self._durations[body_part] += self._cycle_interval_seconds
-            else:
-                self._durations[body_part] = 0
+        # (부위 목록은 최대 7개라 집합을 새로 만드는 것보다 리스트에서 바로 찾는 편이 빠름)
+        durations = self._durations
+        interval = self._cycle_interval_seconds
+        for body_part in _BODY_PARTS:
+            durations[body_part] = durations[body_part] + interval if body_part in active_parts else 0
 
         # DayLog 누적값 업데이트
         self._update_daylog_totals()
@@ -47,62 +70,73 @@ class LogManager(ILogManager):
 
     def _update_daylog_totals(self) -> None:
         """DayLog 누적값 업데이트"""
-        if self._current_daylog is None:
-            self._current_daylog = DayLog.create_empty(self._device_id, date.today())
+        today = self._current_day()
 
-        # 오늘 날짜가 아니면 새로 생성
-        if self._current_daylog.day != date.today():
-            self._current_daylog = DayLog.create_empty(self._device_id, date.today())
+        # 없거나 오늘 날짜가 아니면 새로 생성
+        if self._current_daylog is None or self._current_daylog.day != today:
+            self._current_daylog = DayLog.create_empty(self._device_id, today)
 
         # 누적 시간 업데이트
-        self._current_daylog.total_occiput = self._durations[BodyPart.OCCIPUT]
-        self._current_daylog.total_scapula = self._durations[BodyPart.SCAPULA]
-        self._current_daylog.total_right_elbow = self._durations[BodyPart.RIGHT_ELBOW]
-        self._current_daylog.total_left_elbow = self._durations[BodyPart.LEFT_ELBOW]
-        self._current_daylog.total_hip = self._durations[BodyPart.HIP]
-        self._current_daylog.total_right_heel = self._durations[BodyPart.RIGHT_HEEL]
-        self._current_daylog.total_left_heel = self._durations[BodyPart.LEFT_HEEL]
-
-    def get_durations(self) -> dict[BodyPart, int]:
-        """부위별 압력 지속 시간 반환 (초)"""
+        daylog = self._current_daylog
+        durations = self._durations
+        daylog.total_occiput = durations[BodyPart.OCCIPUT]
+        daylog.total_scapula = durations[BodyPart.SCAPULA]
+        daylog.total_right_elbow = durations[BodyPart.RIGHT_ELBOW]
+        daylog.total_left_elbow = durations[BodyPart.LEFT_ELBOW]
+        daylog.total_hip = durations[BodyPart.HIP]
+        daylog.total_right_heel = durations[BodyPart.RIGHT_HEEL]
+        daylog.total_left_heel = durations[BodyPart.LEFT_HEEL]
+
+    def get_durations(self) -> Mapping[BodyPart, int]:
+        """부위별 압력 지속 시간 반환 (초, 다음 record 호출 시 함께 갱신되는 읽기 전용 뷰)"""
+        return self._durations_view
+
+    def get_durations_copy(self) -> dict[BodyPart, int]:
+        """부위별 압력 지속 시간 스냅샷 반환 (초)"""
         return self._durations.copy()
 
     def get_current_daylog(self) -> DayLog:
         """현재 DayLog 반환"""
         if self._current_daylog is None:
-            self._current_daylog = DayLog.create_empty(self._device_id, date.today())
+            self._current_daylog = DayLog.create_empty(self._device_id, self._current_day())
         return self._current_daylog
 
     def set_daylog(self, daylog: DayLog) -> None:
         """DayLog 설정 (서버에서 로드한 경우)"""
         self._current_daylog = daylog
         # 누적 시간을 현재 durations로 복원
-        self._durations[BodyPart.OCCIPUT] = daylog.total_occiput
-        self._durations[BodyPart.SCAPULA] = daylog.total_scapula
-        self._durations[BodyPart.RIGHT_ELBOW] = daylog.total_right_elbow
-        self._durations[BodyPart.LEFT_ELBOW] = daylog.total_left_elbow
-        self._durations[BodyPart.HIP] = daylog.total_hip
-        self._durations[BodyPart.RIGHT_HEEL] = daylog.total_right_heel
-        self._durations[BodyPart.LEFT_HEEL] = daylog.total_left_heel
+        durations = self._durations
+        durations[BodyPart.OCCIPUT] = daylog.total_occiput
+        durations[BodyPart.SCAPULA] = daylog.total_scapula
+        durations[BodyPart.RIGHT_ELBOW] = daylog.total_right_elbow
+        durations[BodyPart.LEFT_ELBOW] = daylog.total_left_elbow
+        durations[BodyPart.HIP] = daylog.total_hip
+        durations[BodyPart.RIGHT_HEEL] = daylog.total_right_heel
+        durations[BodyPart.LEFT_HEEL] = daylog.total_left_heel
 
     def create_pressure_log(
         self,
         day_id: int,
         posture: PostureType,
         posture_change_required: bool,
+        created_at: datetime | None = None,
     ) -> PressureLog:
-        """PressureLog 생성 - 부위별 누적 시간(초) 포함"""
+        """PressureLog 생성 - 부위별 누적 시간(초) 포함
+
+        created_at을 주면 (예: 사이클 시작 시각) 그 값을 사용하고, 없으면 현재 시각
+        """
+        durations = self._durations
         return PressureLog(
             id=0,  # 서버에서 생성
             day_id=day_id,
-            created_at=datetime.now(),
-            occiput=self._durations[BodyPart.OCCIPUT],
-            scapula=self._durations[BodyPart.SCAPULA],
-            right_elbow=self._durations[BodyPart.RIGHT_ELBOW],
-            left_elbow=self._durations[BodyPart.LEFT_ELBOW],
-            hip=self._durations[BodyPart.HIP],
-            right_heel=self._durations[BodyPart.RIGHT_HEEL],
-            left_heel=self._durations[BodyPart.LEFT_HEEL],
+            created_at=created_at if created_at is not None else datetime.now(),
+            occiput=durations[BodyPart.OCCIPUT],
+            scapula=durations[BodyPart.SCAPULA],
+            right_elbow=durations[BodyPart.RIGHT_ELBOW],
+            left_elbow=durations[BodyPart.LEFT_ELBOW],
+            hip=durations[BodyPart.HIP],
+            right_heel=durations[BodyPart.RIGHT_HEEL],
+            left_heel=durations[BodyPart.LEFT_HEEL],
             posture=posture,
             posture_change_required=posture_change_required,
         )
@@ -113,16 +147,19 @@ class LogManager(ILogManager):
         posture_change_required: bool,
     ) -> PressureLog:
         """기존 PressureLog의 누적 시간 업데이트"""
-        pressure_log.occiput = self._durations[BodyPart.OCCIPUT]
-        pressure_log.scapula = self._durations[BodyPart.SCAPULA]
-        pressure_log.right_elbow = self._durations[BodyPart.RIGHT_ELBOW]
-        pressure_log.left_elbow = self._durations[BodyPart.LEFT_ELBOW]
-        pressure_log.hip = self._durations[BodyPart.HIP]
-        pressure_log.right_heel = self._durations[BodyPart.RIGHT_HEEL]
-        pressure_log.left_heel = self._durations[BodyPart.LEFT_HEEL]
+        durations = self._durations
+        pressure_log.occiput = durations[BodyPart.OCCIPUT]
+        pressure_log.scapula = durations[BodyPart.SCAPULA]
+        pressure_log.right_elbow = durations[BodyPart.RIGHT_ELBOW]
+        pressure_log.left_elbow = durations[BodyPart.LEFT_ELBOW]
+        pressure_log.hip = durations[BodyPart.HIP]
+        pressure_log.right_heel = durations[BodyPart.RIGHT_HEEL]
+        pressure_log.left_heel = durations[BodyPart.LEFT_HEEL]
         pressure_log.posture_change_required = posture_change_required
         return pressure_log
 
     def reset_durations(self) -> None:
-        """지속 시간 초기화"""
-        self._durations = {part: 0 for part in BodyPart}
+        """지속 시간 초기화 (읽기 전용 뷰가 같은 dict를 가리키도록 제자리 갱신)"""
+        durations = self._durations
+        for body_part in _BODY_PARTS:
+            durations[body_part] = 0
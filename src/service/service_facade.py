@@ -1,6 +1,10 @@
-from datetime import datetime, date
+import asyncio
+import logging
+from datetime import datetime
 from typing import Optional, Callable, Awaitable
 
+import numpy as np
+
 from interfaces.communication import (
     ISerialReader,
     IServerClient,
@@ -14,6 +18,7 @@ from interfaces.service import (
     IAlertChecker,
     IServiceFacade,
 )
+from domain.enums import BODY_PART_KEYS, PostureType
 from domain.models import Patient, CycleResult, ControlPacket, PressureLog
 from service.heatmap_converter import HeatmapConverter
 
@@ -42,29 +47,33 @@ class ServiceFacade(IServiceFacade):
         self._pressure_analyzer = pressure_analyzer
         self._log_manager = log_manager
         self._alert_checker = alert_checker
+        self._logger = logging.getLogger("service_facade")
         self._heatmap_converter = heatmap_converter
         self._device_id = device_id
         self._patient: Optional[Patient] = None
         self._sensor_data_callback: Optional[Callable[[dict], Awaitable[None]]] = None
         self._current_pressure_log: Optional[PressureLog] = None  # 현재 자세의 PressureLog
+        # 매 사이클 새로 만들지 않고 내용만 갱신해서 보내는 전송 전용 통합 패킷
+        # (send_packet은 사이클 안에서 완료되므로 재사용 가능, 외부에는 CycleResult의 사본만 노출)
+        self._control_packet = ControlPacket(posture=PostureType.UNKNOWN, active_parts=[], durations={})
+        self._heatmap_task: Optional[asyncio.Task] = None  # 전송 중인 히트맵 업데이트 (최대 1개)
+        # 히트맵 더블 버퍼: [0]은 이번 사이클에 채울 버퍼, [1]은 전송 중인 업데이트가 참조할 수 있는 버퍼
+        self._heatmap_bufs = [np.empty((14, 7), dtype=np.float32), np.empty((14, 7), dtype=np.float32)]
 
     async def initialize(self) -> None:
         """초기화 - 환자 정보 로드"""
         # Supabase 클라이언트 초기화
         await self._server_client.initialize()
 
-        # device_id로 환자 정보 조회
-        self._patient = await self._server_client.async_fetch_patient_with_device(
-            self._device_id
-        )
-
         # 로그 매니저에 device_id 설정
         self._log_manager.set_device_id(self._device_id)
 
-        # 오늘 날짜의 DayLog 조회 또는 생성
-        today = date.today().isoformat()
-        daylog = await self._server_client.async_fetch_daylog_by_date(
-            self._device_id, today
+        # device_id로 환자 정보 조회 + 오늘 날짜의 DayLog 조회 (서로 독립적이므로 동시에 요청)
+        # 날짜는 LogManager가 방금 만든 DayLog 기준으로 맞춤 (date.today() 재호출 없이 같은 날짜 사용)
+        today = self._log_manager.get_current_daylog().day.isoformat()
+        self._patient, daylog = await asyncio.gather(
+            self._server_client.async_fetch_patient_with_device(self._device_id),
+            self._server_client.async_fetch_daylog_by_date(self._device_id, today),
         )
 
         if daylog:
@@ -85,8 +94,7 @@ class ServiceFacade(IServiceFacade):
             sensor_data: 컨트롤 노드에서 수신한 센서 데이터
                         예: {"inflated_zones": [1, 3], "timestamp": "2025-11-29T10:30:00.123456"}
         """
-        import logging
-        logger = logging.getLogger("service_facade")
+        logger = self._logger
         logger.info(f"Sensor data received from control node: {sensor_data}")
 
         # Supabase 채널로 센서 데이터 브로드캐스팅
@@ -103,14 +111,28 @@ class ServiceFacade(IServiceFacade):
 
     async def process_cycle(self) -> CycleResult:
         """한 사이클 처리 후 결과 반환"""
+        # 사이클 시각은 한 번만 읽어 PressureLog와 결과에 같은 값으로 사용
+        cycle_ts = datetime.now()
+
+        # 사이클 동안 여러 번 참조하는 의존성은 지역 변수로 고정 (속성 조회 반복 방지)
+        server = self._server_client
+        log_manager = self._log_manager
+        patient = self._patient
+        device_id = self._device_id
+
         # (b) 시리얼 데이터 읽기 (비동기로 별도 스레드에서 실행)
         head, body = await self._serial_reader.async_read()
 
-        # head (2, 3) + body (12, 7) → heatmap (14, 7)
-        heatmap = self._heatmap_converter.convert(head, body)
+        # head (2, 3) + body (12, 7) → heatmap (14, 7) (미리 할당한 버퍼에 채움)
+        heatmap_bufs = self._heatmap_bufs
+        heatmap = self._heatmap_converter.convert(head, body, out=heatmap_bufs[0])
 
-        # 히트맵 실시간 업데이트
-        await self._server_client.async_update_heatmap(self._device_id, heatmap)
+        # 히트맵 실시간 업데이트 (표시용이므로 사이클을 기다리게 하지 않음)
+        # 이전 전송이 아직 진행 중이면 이번 프레임은 건너뜀
+        if self._heatmap_task is None or self._heatmap_task.done():
+            self._heatmap_task = asyncio.create_task(server.async_update_heatmap(device_id, heatmap))
+            # 전송이 끝나기 전에 다음 사이클이 덮어쓰지 않도록 버퍼 교체
+            heatmap_bufs.reverse()
 
         # (f) 자세 추론
         detection_result = self._posture_detector.detect(heatmap)
@@ -120,75 +142,128 @@ class ServiceFacade(IServiceFacade):
         active_parts = self._pressure_analyzer.analyze(posture)
 
         # (h) 로그 기록
-        posture_changed = self._log_manager.record(active_parts, posture)
-        durations = self._log_manager.get_durations()
+        posture_changed = log_manager.record(active_parts, posture)
+        durations = log_manager.get_durations()
 
         # 자세 변경 필요 여부 확인
         posture_change_required = False
-        if self._patient:
+        if patient:
             posture_change_required = self._alert_checker.check_posture_change_required(
-                self._patient, durations
+                patient, durations
             )
 
-        # PressureLog 처리
-        daylog = self._log_manager.get_current_daylog()
-
+        # 서로 독립적인 서버 요청은 동시에 전송
+        # - DayLog는 매 사이클 upsert (날짜가 바뀌어 새로 만든 DayLog도 서버 id를 받아옴)
+        # - device 정보 조회 (controls, activate_air 포함)
+        # - 자세 변경 시 새 PressureLog 생성, 자세 유지 시 기존 PressureLog 업데이트
+        daylog = log_manager.get_current_daylog()
+        requests = [
+            server.async_upsert_daylog(daylog),
+            server.async_fetch_device(device_id),
+        ]
         if posture_changed:
-            # 자세 변경 시 새 PressureLog 생성
-            self._current_pressure_log = self._log_manager.create_pressure_log(
-                day_id=daylog.id,
-                posture=posture,
-                posture_change_required=posture_change_required,
-            )
-            # (a) 서버에 새 로그 생성
-            created_log = await self._server_client.async_create_pressurelog(self._current_pressure_log)
-            if created_log:
-                self._current_pressure_log = created_log  # 서버에서 반환된 id 저장
+            # 새 PressureLog는 DayLog의 서버 id가 필요하므로, 이미 알고 있을 때만 upsert와 같이 전송
+            if daylog.id:
+                self._current_pressure_log = self._create_pressure_log(
+                    daylog.id, posture, posture_change_required, cycle_ts
+                )
+                # (a) 서버에 새 로그 생성
+                requests.append(server.async_create_pressurelog(self._current_pressure_log))
         elif self._current_pressure_log:
-            # 자세 유지 시 기존 PressureLog 업데이트
-            self._current_pressure_log = self._log_manager.update_pressure_log(
+            self._current_pressure_log = log_manager.update_pressure_log(
                 self._current_pressure_log,
                 posture_change_required=posture_change_required,
             )
-            await self._server_client.async_update_pressurelog(self._current_pressure_log)
+            requests.append(server.async_update_pressurelog(self._current_pressure_log))
+
+        upserted_daylog, device_data, *log_results = await asyncio.gather(*requests)
+        if upserted_daylog:
+            daylog.id = upserted_daylog.id
 
-        # DayLog는 매 사이클 업데이트
-        await self._server_client.async_update_daylog(daylog)
+        if posture_changed:
+            if log_results:
+                created_log = log_results[0]
+            else:
+                # 날짜가 바뀌어 새로 만든 DayLog는 upsert로 받은 id로 생성
+                self._current_pressure_log = self._create_pressure_log(
+                    daylog.id, posture, posture_change_required, cycle_ts
+                )
+                created_log = await server.async_create_pressurelog(self._current_pressure_log)
+            if created_log:
+                self._current_pressure_log = created_log  # 서버에서 반환된 id 저장
 
-        # 서버에서 device 정보 조회 (controls, activate_air 포함)
-        device_data = await self._server_client.async_fetch_device(self._device_id)
         controls = device_data.controls if device_data else None
         activate_air = device_data.activate_air if device_data else False
 
-        # 통합 패킷 생성
-        control_packet = ControlPacket(
-            posture=posture,
-            active_parts=[bp.value for bp in active_parts],
-            durations={bp.value: v for bp, v in durations.items()},
-            controls=controls,
-            activate_air=activate_air,
-        )
-
-        # (c) 컨트롤 노드에 통합 패킷 전송
-        await self._control_sender.send_packet(control_packet)
-
-        # 알림 체크 및 전송
+        # 통합 패킷 갱신 (BodyPart.key 프로퍼티 호출 대신 키 튜플을 직접 인덱싱)
+        keys = BODY_PART_KEYS
+        control_packet = self._control_packet
+        control_packet.posture = posture
+        packet_parts = control_packet.active_parts
+        packet_parts.clear()
+        packet_parts.extend(map(keys.__getitem__, active_parts))
+        packet_durations = control_packet.durations
+        packet_durations.clear()
+        for bp, v in durations.items():
+            packet_durations[keys[bp]] = v
+        control_packet.controls = controls
+        control_packet.activate_air = activate_air
+
+        # 알림 체크
+        alert_message = None
+        if patient and posture_change_required:
+            alert_message = self._alert_checker.check(patient, durations)
+
+        # (c) 컨트롤 노드에 통합 패킷 전송 + (e) 푸시 알림 전송 (서로 독립적이므로 동시에)
         alert_sent = False
-        if self._patient and posture_change_required:
-            alert_message = self._alert_checker.check(self._patient, durations)
-            if alert_message:
-                # (e) 푸시 알림 전송
-                await self._notifier.send_notification(alert_message)
+        if alert_message:
+            # 한쪽이 실패해도 다른 쪽이 끝까지 실행되도록 예외를 결과로 받는다
+            send_result, notify_result = await asyncio.gather(
+                self._control_sender.send_packet(control_packet),
+                self._notifier.send_notification(alert_message),
+                return_exceptions=True,
+            )
+            if isinstance(notify_result, BaseException):
+                self._logger.error("Failed to send notification: %s", notify_result)
+            else:
                 alert_sent = True
+            if isinstance(send_result, BaseException):
+                raise send_result  # 컨트롤 노드 연결 오류는 호출자의 재연결 처리로 전달
+        else:
+            await self._control_sender.send_packet(control_packet)
 
         return CycleResult(
             posture=posture,
             pressure_log=self._current_pressure_log,
-            control_packet=control_packet,
+            # 패킷 객체는 다음 사이클에서 재사용되므로 결과에는 사본을 담는다
+            control_packet=ControlPacket(
+                posture=posture,
+                active_parts=list(packet_parts),
+                durations=dict(packet_durations),
+                controls=dict(controls) if controls is not None else None,
+                activate_air=activate_air,
+            ),
             alert_sent=alert_sent,
             posture_change_required=posture_change_required,
-            durations=durations,
-            timestamp=datetime.now(),
+            durations=log_manager.get_durations_copy(),  # 결과는 다음 사이클 이후에도 표시되므로 스냅샷 사용
+            timestamp=cycle_ts,
+        )
+
+    async def close(self) -> None:
+        """종료 - 진행 중인 히트맵 업데이트 완료 대기"""
+        if self._heatmap_task is not None:
+            await asyncio.gather(self._heatmap_task, return_exceptions=True)
+            self._heatmap_task = None
+
+    def _create_pressure_log(
+        self, day_id: int, posture: PostureType, posture_change_required: bool, created_at: datetime
+    ) -> PressureLog:
+        """자세 변경 시 서버에 보낼 새 PressureLog 생성"""
+        return self._log_manager.create_pressure_log(
+            day_id=day_id,
+            posture=posture,
+            posture_change_required=posture_change_required,
+            created_at=created_at,
         )
 
     def get_patient(self) -> Optional[Patient]:
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# 애플리케이션 코드는 src/를 루트로 한 절대 import를 사용 (python src/main.py 실행과 동일)
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -4,16 +4,96 @@ import numpy as np
 from interfaces.communication import ISerialReader
 
 
+def _freeze(head: np.ndarray, body: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """모든 read 호출이 같은 배열을 공유하므로 수정 불가로 고정"""
+    head.setflags(write=False)
+    body.setflags(write=False)
+    return head, body
+
+
+def _build_supine() -> tuple[np.ndarray, np.ndarray]:
+    """앙와위 자세 패턴 (기본)"""
+    head = np.zeros((2, 3), dtype=np.float32)
+    body = np.zeros((12, 7), dtype=np.float32)
+
+    # 후두부 영역 (head)
+    head[0:2, 0:3] = 400
+
+    # 견갑골 영역 (body 상단)
+    body[0:2, 1:6] = 300
+    # 엉덩이 영역 (body 중앙)
+    body[5:8, 1:6] = 600
+    # 발뒤꿈치 영역 (body 하단)
+    body[10:12, 1:3] = 350
+    body[10:12, 4:6] = 350
+
+    return _freeze(head, body)
+
+
+def _build_left_side() -> tuple[np.ndarray, np.ndarray]:
+    """좌측위 자세 패턴 (왼쪽 열에 압력 집중)"""
+    head = np.zeros((2, 3), dtype=np.float32)
+    body = np.zeros((12, 7), dtype=np.float32)
+
+    head[0:2, 0:1] = 400
+    # 어깨/팔꿈치, 엉덩이, 발뒤꿈치 (왼쪽)
+    body[0:3, 0:2] = 450
+    body[5:8, 0:3] = 600
+    body[10:12, 0:2] = 350
+
+    return _freeze(head, body)
+
+
+def _build_right_side() -> tuple[np.ndarray, np.ndarray]:
+    """우측위 자세 패턴 (좌측위의 좌우 반전)"""
+    head, body = _build_left_side()
+    return _freeze(head[:, ::-1].copy(), body[:, ::-1].copy())
+
+
+def _build_prone() -> tuple[np.ndarray, np.ndarray]:
+    """복와위 자세 패턴 (가슴, 골반, 무릎)"""
+    head = np.zeros((2, 3), dtype=np.float32)
+    body = np.zeros((12, 7), dtype=np.float32)
+
+    head[1:2, 1:2] = 200
+    body[1:4, 1:6] = 350
+    body[5:7, 2:5] = 400
+    body[8:10, 1:3] = 250
+    body[8:10, 4:6] = 250
+
+    return _freeze(head, body)
+
+
+def _build_empty() -> tuple[np.ndarray, np.ndarray]:
+    """빈 매트 (압력 없음)"""
+    return _freeze(np.zeros((2, 3), dtype=np.float32), np.zeros((12, 7), dtype=np.float32))
+
+
+# 시나리오 이름 -> (head, body) 패턴 (import 시 한 번만 생성, 모든 인스턴스가 공유)
+_SCENARIOS: dict[str, tuple[np.ndarray, np.ndarray]] = {
+    "supine": _build_supine(),
+    "left_side": _build_left_side(),
+    "right_side": _build_right_side(),
+    "prone": _build_prone(),
+    "empty": _build_empty(),
+}
+
+
 class MockSerialHandler(ISerialReader):
     """테스트용 Mock 시리얼 핸들러"""
 
+    # 기본 패턴 (앙와위)
+    _DEFAULT_HEAD, _DEFAULT_BODY = _SCENARIOS["supine"]
+
     def __init__(
         self,
         preset_head: np.ndarray | None = None,
         preset_body: np.ndarray | None = None,
+        simulate_blocking: bool = False,
     ):
         self._preset_head = preset_head
         self._preset_body = preset_body
+        self._simulate_blocking = simulate_blocking  # True면 실제 SerialReader처럼 스레드에서 read 실행
         self._connected = False
 
     def connect(self) -> None:
@@ -27,28 +107,23 @@ class MockSerialHandler(ISerialReader):
         if self._preset_head is not None and self._preset_body is not None:
             return self._preset_head, self._preset_body
 
-        # 기본: 앙와위 자세 패턴 생성
-        head = np.zeros((2, 3), dtype=np.float32)
-        body = np.zeros((12, 7), dtype=np.float32)
-
-        # 후두부 영역 (head)
-        head[0:2, 0:3] = 400
-
-        # 견갑골 영역 (body 상단)
-        body[0:2, 1:6] = 300
-        # 엉덩이 영역 (body 중앙)
-        body[5:8, 1:6] = 600
-        # 발뒤꿈치 영역 (body 하단)
-        body[10:12, 1:3] = 350
-        body[10:12, 4:6] = 350
-
-        return head, body
+        return self._DEFAULT_HEAD, self._DEFAULT_BODY
 
     async def async_read(self, timeout: float = 5.0) -> tuple[np.ndarray, np.ndarray]:
-        """비동기 Mock 데이터 반환"""
-        return await asyncio.to_thread(self.read, timeout)
+        """비동기 Mock 데이터 반환
+
+        Mock은 블로킹 I/O가 없으므로 기본적으로 스레드 풀을 거치지 않고 바로 반환
+        (simulate_blocking=True면 블로킹 read를 흉내 내도록 스레드에서 실행)
+        """
+        if self._simulate_blocking:
+            return await asyncio.to_thread(self.read, timeout)
+        return self.read(timeout)
 
     def set_data(self, head: np.ndarray, body: np.ndarray) -> None:
         """테스트용 데이터 설정"""
         self._preset_head = head
         self._preset_body = body
+
+    def select_scenario(self, name: str) -> None:
+        """미리 만들어 둔 시나리오 패턴으로 전환 (supine, left_side, right_side, prone, empty)"""
+        self._preset_head, self._preset_body = _SCENARIOS[name]
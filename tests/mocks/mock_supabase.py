@@ -13,13 +13,18 @@ class MockSupabaseClient(IServerClient):
     def __init__(self):
         self._devices: dict[int, DeviceData] = {}
         self._patients: dict[int, Patient] = {}  # key: device_id
-        self._daylogs: List[DayLog] = []
-        self._pressurelogs: List[PressureLog] = []
+        self._daylogs: dict[int, DayLog] = {}  # key: id
+        self._pressurelogs: dict[int, PressureLog] = {}  # key: id
+        self._daylog_by_device_day: dict[tuple[int, str], DayLog] = {}  # key: (device_id, 날짜 ISO 문자열)
 
     async def initialize(self) -> None:
         """초기화 (Mock은 아무것도 안함)"""
         pass
 
+    async def close(self) -> None:
+        """종료 (Mock은 아무것도 안함)"""
+        pass
+
     # Device 관련
     async def async_fetch_device(self, device_id: int) -> Optional[DeviceData]:
         return self._devices.get(device_id)
@@ -50,23 +55,32 @@ class MockSupabaseClient(IServerClient):
             total_right_heel=daylog.total_right_heel,
             total_left_heel=daylog.total_left_heel,
         )
-        self._daylogs.append(daylog_with_id)
+        self._store_daylog(daylog_with_id)
         return daylog_with_id
 
+    def _store_daylog(self, daylog: DayLog) -> None:
+        """id 인덱스와 (device_id, 날짜) 인덱스에 함께 저장"""
+        self._daylogs[daylog.id] = daylog
+        self._daylog_by_device_day[(daylog.device_id, daylog.day.isoformat())] = daylog
+
     async def async_update_daylog(self, daylog: DayLog) -> Optional[DayLog]:
-        for i, dl in enumerate(self._daylogs):
-            if dl.id == daylog.id:
-                self._daylogs[i] = daylog
-                return daylog
-        return None
+        if daylog.id not in self._daylogs:
+            return None
+        self._store_daylog(daylog)
+        return daylog
+
+    async def async_upsert_daylog(self, daylog: DayLog) -> Optional[DayLog]:
+        existing = self._daylog_by_device_day.get((daylog.device_id, daylog.day.isoformat()))
+        if existing is None:
+            return await self.async_create_daylog(daylog)
+        daylog.id = existing.id
+        self._store_daylog(daylog)
+        return daylog
 
     async def async_fetch_daylog_by_date(
         self, device_id: int, day: str
     ) -> Optional[DayLog]:
-        for dl in self._daylogs:
-            if dl.device_id == device_id and dl.day.isoformat() == day:
-                return dl
-        return None
+        return self._daylog_by_device_day.get((device_id, day))
 
     # PressureLog 관련
     async def async_create_pressurelog(
@@ -86,31 +100,49 @@ class MockSupabaseClient(IServerClient):
             posture=pressurelog.posture,
             posture_change_required=pressurelog.posture_change_required,
         )
-        self._pressurelogs.append(log_with_id)
+        self._pressurelogs[log_with_id.id] = log_with_id
         return log_with_id
 
     async def async_update_pressurelog(
         self, pressurelog: PressureLog
     ) -> Optional[PressureLog]:
-        for i, pl in enumerate(self._pressurelogs):
-            if pl.id == pressurelog.id:
-                self._pressurelogs[i] = pressurelog
-                return pressurelog
-        return None
+        if pressurelog.id not in self._pressurelogs:
+            return None
+        self._pressurelogs[pressurelog.id] = pressurelog
+        return pressurelog
 
     # Heatmap
     async def async_update_heatmap(self, device_id: int, heatmap: np.ndarray) -> bool:
         return True
 
+    # Controls
+    async def async_fetch_device_controls(self, device_id: int) -> Optional[dict]:
+        device = self._devices.get(device_id)
+        return device.controls if device else None
+
+    async def async_broadcast_controls(self, device_id: int, controls_data: dict) -> bool:
+        return True
+
     # 테스트 헬퍼 메서드
-    def get_pressurelogs(self) -> List[PressureLog]:
-        return self._pressurelogs.copy()
+    def get_pressurelogs(self) -> tuple[PressureLog, ...]:
+        """저장된 PressureLog 목록 (생성 순서, 인덱싱 가능한 읽기 전용 tuple)"""
+        return tuple(self._pressurelogs.values())
+
+    def get_daylogs(self) -> tuple[DayLog, ...]:
+        """저장된 DayLog 목록 (생성 순서, 인덱싱 가능한 읽기 전용 tuple)"""
+        return tuple(self._daylogs.values())
+
+    def snapshot_pressurelogs(self) -> List[PressureLog]:
+        """현재 시점 PressureLog 목록 복사본 (수정 가능한 list가 필요한 테스트용)"""
+        return list(self._pressurelogs.values())
 
-    def get_daylogs(self) -> List[DayLog]:
-        return self._daylogs.copy()
+    def snapshot_daylogs(self) -> List[DayLog]:
+        """현재 시점 DayLog 목록 복사본 (수정 가능한 list가 필요한 테스트용)"""
+        return list(self._daylogs.values())
 
     def clear(self) -> None:
         self._devices.clear()
         self._patients.clear()
         self._daylogs.clear()
         self._pressurelogs.clear()
+        self._daylog_by_device_day.clear()
@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import logging
+
+import pytest
+
+import main
+from main import Application
+
+
+_real_sleep = asyncio.sleep
+
+
+def _make_app() -> Application:
+    """컨테이너 없이 재연결 루프만 검사할 Application (설정/의존성 생성 생략)"""
+    app = Application.__new__(Application)
+    app._running = True
+    app._logger = logging.getLogger("test_reconnect")
+    app.status_updates = 0
+
+    def show_status() -> None:
+        app.status_updates += 1
+
+    app._show_connection_status = show_status
+    return app
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """asyncio.sleep 호출 시간을 기록하고 바로 반환"""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay, result=None):
+        recorded.append(delay)
+        await _real_sleep(0)
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+async def _run_until(predicate, timeout: float = 1.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached"
+        await _real_sleep(0)
+
+
+async def _stop(app: Application, task: asyncio.Task) -> None:
+    app._running = False
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_reconnect_waits_for_lost_event(sleeps):
+    """연결이 끊기기 전에는 재연결을 시도하지 않음"""
+    app = _make_app()
+    lost = asyncio.Event()
+    attempts = 0
+
+    async def connect() -> bool:
+        nonlocal attempts
+        attempts += 1
+        return True
+
+    task = asyncio.create_task(app._reconnect_loop("test", connect, lost))
+    for _ in range(10):
+        await _real_sleep(0)
+
+    assert attempts == 0
+    assert sleeps == []
+
+    await _stop(app, task)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_exponentially_until_success(sleeps):
+    """실패할 때마다 대기 시간을 두 배로 늘리고, 성공하면 이벤트를 초기화"""
+    app = _make_app()
+    lost = asyncio.Event()
+    results = iter([False, False, False, True])
+    attempts = 0
+
+    async def connect() -> bool:
+        nonlocal attempts
+        attempts += 1
+        return next(results)
+
+    task = asyncio.create_task(app._reconnect_loop("test", connect, lost))
+    lost.set()
+    await _run_until(lambda: app.status_updates == 1)
+
+    assert attempts == 4
+    assert sleeps == [1.0, 2.0, 4.0, 8.0]
+    assert not lost.is_set()
+
+    await _stop(app, task)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_delay_is_capped(sleeps, monkeypatch):
+    """대기 시간은 RECONNECT_MAX_DELAY를 넘지 않음"""
+    monkeypatch.setattr(main, "RECONNECT_MAX_DELAY", 5.0)
+    app = _make_app()
+    lost = asyncio.Event()
+    attempts = 0
+
+    async def connect() -> bool:
+        nonlocal attempts
+        attempts += 1
+        return attempts >= 6
+
+    task = asyncio.create_task(app._reconnect_loop("test", connect, lost))
+    lost.set()
+    await _run_until(lambda: app.status_updates == 1)
+
+    assert sleeps == [1.0, 2.0, 4.0, 5.0, 5.0, 5.0]
+
+    await _stop(app, task)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_stops_when_application_stops(sleeps):
+    """종료 중에는 대기 후 재연결을 시도하지 않고 루프를 끝냄"""
+    app = _make_app()
+    lost = asyncio.Event()
+    attempts = 0
+
+    async def connect() -> bool:
+        nonlocal attempts
+        attempts += 1
+        app._running = False
+        return False
+
+    lost.set()
+    await asyncio.wait_for(app._reconnect_loop("test", connect, lost), 1.0)
+
+    assert attempts == 1
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from communication import serial_handler
+from communication.serial_handler import SerialHandler, crc8, decode_frame, encode_frame
+
+
+def test_frame_round_trip():
+    """인코딩한 프레임을 그대로 디코딩"""
+    values = [0, 1, -1, 1023, -32768, 32767]
+    frame = encode_frame(3, values)
+
+    assert frame[0] == serial_handler.FRAME_START
+    assert frame.endswith(b"\n")
+    assert decode_frame(frame) == (3, values)
+
+
+def test_frame_escapes_newline_and_escape_bytes():
+    """값에 0x0A/0xDB가 있어도 프레임 안에는 끝 개행 하나만 남음"""
+    values = [0x0A0A, 0x00DB, 0xDBDB - 0x10000, 0x0ADB]
+    frame = encode_frame(1, values)
+
+    assert frame.count(b"\n") == 1
+    assert decode_frame(frame) == (1, values)
+
+
+def test_frame_with_no_channels():
+    """채널이 없는 프레임도 헤더와 CRC만으로 유효"""
+    assert decode_frame(encode_frame(0, [])) == (0, [])
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        encode_frame(2, [1, 2, 3])[:-1],                     # 개행 전에 끊김
+        encode_frame(2, [1, 2, 3])[:5] + b"\n",              # 데이터 누락
+        bytes((serial_handler.FRAME_START, 9, 0, crc8(bytes((9, 0))))) + b"\n",   # 없는 보드
+        bytes((serial_handler.FRAME_START, 1, 15)) + bytes(31) + b"\n",           # 채널 수 초과
+        bytes((serial_handler.FRAME_START,)) + b"\n",        # 빈 프레임
+    ],
+)
+def test_invalid_frames_are_rejected(frame):
+    """길이/헤더가 맞지 않는 프레임은 None"""
+    assert decode_frame(frame) is None
+
+
+def test_corrupted_frame_fails_crc():
+    """한 바이트라도 바뀌면 CRC 검사에서 버림"""
+    frame = bytearray(encode_frame(4, [100, 200, 300]))
+    frame[4] ^= 0x01
+
+    assert decode_frame(bytes(frame)) is None
+
+
+class _FakeSerial:
+    def reset_input_buffer(self) -> None:
+        pass
+
+
+class _FakeTransport:
+    serial = _FakeSerial()
+
+    def pause_reading(self) -> None:
+        pass
+
+    def resume_reading(self) -> None:
+        pass
+
+
+class _FakeWriter:
+    transport = _FakeTransport()
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_reader_resynchronises_after_corrupted_frame(monkeypatch):
+    """손상된 프레임 뒤의 바이너리 프레임과 텍스트 라인을 모두 정상 수신"""
+    reader = asyncio.StreamReader()
+    corrupted = bytearray(encode_frame(1, [5] * 14))
+    del corrupted[6]  # 전송 중 바이트 유실
+    reader.feed_data(bytes(corrupted))
+    reader.feed_data(encode_frame(2, list(range(14))))
+    reader.feed_data(b"UNO0_C0:7 UNO0_C1:8\r\n")
+    reader.feed_eof()
+
+    async def open_serial_connection(url, baudrate):
+        return reader, _FakeWriter()
+
+    real_sleep = asyncio.sleep
+
+    async def skip_reset_wait(delay, result=None):
+        await real_sleep(0)
+        return result
+
+    monkeypatch.setattr(serial_handler.serial_asyncio, "open_serial_connection", open_serial_connection)
+    monkeypatch.setattr(asyncio, "sleep", skip_reset_wait)
+
+    handler = SerialHandler()
+    await handler._serial_reader("/dev/ttyTEST0")
+
+    assert set(handler._boards) == {"UNO2_", "UNO0_"}
+    assert handler._boards["UNO2_"].data["UNO2_C13"] == 13
+    assert handler._boards["UNO0_"].data == {"UNO0_C0": 7, "UNO0_C1": 8}
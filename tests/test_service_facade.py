@@ -0,0 +1,206 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from communication.mock_control_sender import MockControlSender
+from interfaces.communication import INotifier, ControlNodeConnectionError
+from interfaces.service import IPostureDetector
+from domain.enums import PostureType
+from domain.models import AlertMessage, Patient, PostureDetectionResult
+from service import AlertChecker, LogManager, PressureAnalyzer, ServiceFacade
+from service import log_manager as log_manager_module
+from service.heatmap_converter import HeatmapConverter
+from tests.mocks import MockSerialHandler, MockSupabaseClient
+
+
+DEVICE_ID = 7
+
+
+class _FixedPostureDetector(IPostureDetector):
+    """지정한 자세를 그대로 반환하는 감지기"""
+
+    def __init__(self, posture: PostureType = PostureType.SUPINE):
+        self.posture = posture
+
+    def detect(self, pressure_matrix) -> PostureDetectionResult:
+        return PostureDetectionResult(posture_type=self.posture)
+
+
+class _RecordingNotifier(INotifier):
+    """보낸 알림을 기록하는 알림 전송기 (error를 지정하면 전송 시 예외)"""
+
+    def __init__(self, error: Exception | None = None):
+        self.sent: list[AlertMessage] = []
+        self.error = error
+
+    async def send_notification(self, message: AlertMessage) -> bool:
+        if self.error is not None:
+            raise self.error
+        self.sent.append(message)
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+def _patient(threshold: int = 120) -> Patient:
+    return Patient(
+        id=1,
+        device_id=DEVICE_ID,
+        created_at=datetime(2025, 1, 1),
+        occiput_threshold=threshold,
+        scapula_threshold=threshold,
+        right_elbow_threshold=threshold,
+        left_elbow_threshold=threshold,
+        hip_threshold=threshold,
+        right_heel_threshold=threshold,
+        left_heel_threshold=threshold,
+    )
+
+
+async def _make_facade(
+    server: MockSupabaseClient,
+    detector: _FixedPostureDetector,
+    notifier: INotifier | None = None,
+    sender: MockControlSender | None = None,
+) -> tuple[ServiceFacade, LogManager, MockControlSender]:
+    log_manager = LogManager()
+    sender = sender or MockControlSender()
+    await sender.connect()
+    facade = ServiceFacade(
+        serial_reader=MockSerialHandler(),
+        server_client=server,
+        control_sender=sender,
+        notifier=notifier or _RecordingNotifier(),
+        posture_detector=detector,
+        pressure_analyzer=PressureAnalyzer(),
+        log_manager=log_manager,
+        alert_checker=AlertChecker(),
+        heatmap_converter=HeatmapConverter(),
+        device_id=DEVICE_ID,
+    )
+    await facade.initialize()
+    return facade, log_manager, sender
+
+
+class _Yesterday(date):
+    """date.today()가 어제를 반환하는 date (자정 이전 상태 재현용)"""
+
+    @classmethod
+    def today(cls) -> date:
+        return date.today() - timedelta(days=1)
+
+
+@pytest.mark.asyncio
+async def test_posture_change_creates_pressure_log_for_known_daylog():
+    """DayLog 서버 id를 알고 있으면 자세 변경 시 그 id로 PressureLog 생성"""
+    server = MockSupabaseClient()
+    facade, log_manager, _ = await _make_facade(server, _FixedPostureDetector(PostureType.SUPINE))
+    daylog_id = log_manager.get_current_daylog().id
+    assert daylog_id
+
+    result = await facade.process_cycle()
+
+    logs = server.get_pressurelogs()
+    assert len(logs) == 1
+    assert logs[0].day_id == daylog_id
+    assert result.pressure_log.id == logs[0].id
+
+
+@pytest.mark.asyncio
+async def test_posture_change_after_midnight_uses_upserted_daylog_id(monkeypatch):
+    """자정 이후 새 DayLog(id 0)에서 자세가 바뀌면 upsert로 받은 id로 PressureLog 생성"""
+    server = MockSupabaseClient()
+    detector = _FixedPostureDetector(PostureType.SUPINE)
+    with monkeypatch.context() as m:
+        m.setattr(log_manager_module, "date", _Yesterday)
+        facade, log_manager, _ = await _make_facade(server, detector)
+        await facade.process_cycle()
+    yesterday_daylog = log_manager.get_current_daylog()
+    assert yesterday_daylog.day == date.today() - timedelta(days=1)
+
+    # 자정이 지난 것처럼 다음 record에서 날짜를 다시 계산
+    log_manager._next_day_at = 0.0
+    detector.posture = PostureType.LEFT_SIDE
+    await facade.process_cycle()
+
+    new_daylog = log_manager.get_current_daylog()
+    assert new_daylog.day == date.today()
+    assert new_daylog.id not in (0, yesterday_daylog.id)
+    logs = server.get_pressurelogs()
+    assert len(logs) == 2
+    assert logs[0].day_id == yesterday_daylog.id
+    assert logs[-1].day_id == new_daylog.id
+    assert logs[-1].posture == PostureType.LEFT_SIDE
+
+
+@pytest.mark.asyncio
+async def test_same_posture_updates_current_pressure_log():
+    """자세가 유지되면 새 PressureLog 없이 기존 로그를 업데이트"""
+    server = MockSupabaseClient()
+    facade, _, _ = await _make_facade(server, _FixedPostureDetector(PostureType.SUPINE))
+
+    await facade.process_cycle()
+    result = await facade.process_cycle()
+
+    logs = server.get_pressurelogs()
+    assert len(logs) == 1
+    assert result.pressure_log.id == logs[0].id
+
+
+@pytest.mark.asyncio
+async def test_cycle_result_packet_is_not_reused():
+    """CycleResult의 패킷은 다음 사이클에서 덮어쓰지 않는 사본"""
+    server = MockSupabaseClient()
+    detector = _FixedPostureDetector(PostureType.SUPINE)
+    facade, _, _ = await _make_facade(server, detector)
+
+    first = await facade.process_cycle()
+    first_parts = list(first.control_packet.active_parts)
+    detector.posture = PostureType.SITTING
+    second = await facade.process_cycle()
+
+    assert first.control_packet is not second.control_packet
+    assert first.control_packet.posture == PostureType.SUPINE
+    assert first.control_packet.active_parts == first_parts
+    assert second.control_packet.active_parts == ["hip"]
+
+
+@pytest.mark.asyncio
+async def test_notification_failure_still_sends_packet():
+    """알림 전송이 실패해도 패킷은 전송되고 alert_sent는 False"""
+    server = MockSupabaseClient()
+    server.set_patient(_patient(threshold=0))
+    notifier = _RecordingNotifier(error=RuntimeError("fcm down"))
+    sent_packets = []
+
+    class _RecordingSender(MockControlSender):
+        async def send_packet(self, packet):
+            sent_packets.append(packet.posture)
+            return await super().send_packet(packet)
+
+    facade, _, _ = await _make_facade(
+        server, _FixedPostureDetector(PostureType.SUPINE), notifier=notifier, sender=_RecordingSender()
+    )
+
+    result = await facade.process_cycle()
+
+    assert result.posture_change_required
+    assert not result.alert_sent
+    assert sent_packets == [PostureType.SUPINE]
+
+
+@pytest.mark.asyncio
+async def test_packet_failure_is_raised_after_notification():
+    """패킷 전송 오류는 알림 전송을 끝낸 뒤 호출자에게 전달"""
+    server = MockSupabaseClient()
+    server.set_patient(_patient(threshold=0))
+    notifier = _RecordingNotifier()
+    facade, _, sender = await _make_facade(
+        server, _FixedPostureDetector(PostureType.SUPINE), notifier=notifier
+    )
+    await sender.disconnect()
+
+    with pytest.raises(ControlNodeConnectionError):
+        await facade.process_cycle()
+    assert len(notifier.sent) == 1
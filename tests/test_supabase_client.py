@@ -0,0 +1,167 @@
+from datetime import date
+
+import pytest
+
+from communication.supabase_client import SupabaseClient
+from domain.models import DayLog
+
+
+DAY = date(2025, 11, 29)
+
+
+def _daylog_row(daylog_id: int, total_hip: int = 0) -> dict:
+    """day_logs 테이블 응답 행"""
+    return {
+        "id": daylog_id,
+        "day": DAY.isoformat(),
+        "device_id": 7,
+        "total_occiput": 0,
+        "total_scapula": 0,
+        "total_relbow": 0,
+        "total_lelbow": 0,
+        "total_hip": total_hip,
+        "total_rheel": 0,
+        "total_lheel": 0,
+    }
+
+
+class _FakeResponse:
+    def __init__(self, data: list):
+        self.data = data
+
+
+class _FakeQuery:
+    """table().upsert().eq().execute() 체인을 기록하는 쿼리 빌더"""
+
+    def __init__(self, client: "_FakeClient", table: str):
+        self._client = client
+        self._table = table
+        self._op: str | None = None
+        self._payload = None
+        self._kwargs: dict = {}
+        self._filters: list[tuple[str, object]] = []
+
+    def _set_op(self, op: str, payload=None, **kwargs) -> "_FakeQuery":
+        self._op = op
+        self._payload = payload
+        self._kwargs = kwargs
+        return self
+
+    def select(self, columns: str) -> "_FakeQuery":
+        return self._set_op("select", columns)
+
+    def insert(self, payload: dict) -> "_FakeQuery":
+        return self._set_op("insert", payload)
+
+    def update(self, payload: dict) -> "_FakeQuery":
+        return self._set_op("update", payload)
+
+    def upsert(self, payload: dict, **kwargs) -> "_FakeQuery":
+        return self._set_op("upsert", payload, **kwargs)
+
+    def eq(self, column: str, value) -> "_FakeQuery":
+        self._filters.append((column, value))
+        return self
+
+    async def execute(self) -> _FakeResponse:
+        self._client.calls.append((self._table, self._op, self._payload, self._kwargs, self._filters))
+        result = self._client.responses.get((self._table, self._op), [])
+        if isinstance(result, Exception):
+            raise result
+        return _FakeResponse(result)
+
+
+class _FakeClient:
+    """supabase AsyncClient 대역 (테이블/연산별 응답 지정)"""
+
+    def __init__(self, responses: dict):
+        self.responses = responses
+        self.calls: list[tuple] = []
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self, name)
+
+
+def _make_client(responses: dict) -> tuple[SupabaseClient, _FakeClient]:
+    client = SupabaseClient("https://example.supabase.co", "key")
+    fake = _FakeClient(responses)
+    client._client = fake
+    return client, fake
+
+
+def _ops(fake: _FakeClient) -> list[tuple[str, str]]:
+    return [(table, op) for table, op, *_ in fake.calls]
+
+
+@pytest.mark.asyncio
+async def test_upsert_daylog_with_id_updates_by_id():
+    """서버 id를 아는 DayLog는 upsert 없이 id로 업데이트"""
+    client, fake = _make_client({("day_logs", "update"): [_daylog_row(5, total_hip=30)]})
+    daylog = DayLog.create_empty(7, DAY)
+    daylog.id = 5
+    daylog.total_hip = 30
+
+    result = await client.async_upsert_daylog(daylog)
+
+    assert _ops(fake) == [("day_logs", "update")]
+    assert fake.calls[0][4] == [("id", 5)]
+    assert result.id == 5
+    assert result.total_hip == 30
+
+
+@pytest.mark.asyncio
+async def test_upsert_daylog_without_id_upserts_on_device_and_day():
+    """새 DayLog(id 0)는 (device_id, day) 기준 upsert로 서버 id를 받아옴"""
+    client, fake = _make_client({("day_logs", "upsert"): [_daylog_row(9)]})
+
+    result = await client.async_upsert_daylog(DayLog.create_empty(7, DAY))
+
+    assert _ops(fake) == [("day_logs", "upsert")]
+    _, _, payload, kwargs, _ = fake.calls[0]
+    assert kwargs == {"on_conflict": "device_id,day"}
+    assert "id" not in payload
+    assert result.id == 9
+
+
+@pytest.mark.asyncio
+async def test_upsert_daylog_falls_back_to_fetch_then_create():
+    """upsert가 실패하고 같은 날짜 DayLog가 없으면 새로 생성"""
+    client, fake = _make_client({
+        ("day_logs", "upsert"): RuntimeError("no unique constraint"),
+        ("day_logs", "select"): [],
+        ("day_logs", "insert"): [_daylog_row(11)],
+    })
+
+    result = await client.async_upsert_daylog(DayLog.create_empty(7, DAY))
+
+    assert _ops(fake) == [("day_logs", "upsert"), ("day_logs", "select"), ("day_logs", "insert")]
+    assert fake.calls[1][4] == [("device_id", 7), ("day", DAY.isoformat())]
+    assert result.id == 11
+
+
+@pytest.mark.asyncio
+async def test_upsert_daylog_falls_back_to_fetch_then_update():
+    """upsert가 실패해도 같은 날짜 DayLog가 있으면 그 id로 업데이트"""
+    client, fake = _make_client({
+        ("day_logs", "upsert"): RuntimeError("no unique constraint"),
+        ("day_logs", "select"): [_daylog_row(4)],
+        ("day_logs", "update"): [_daylog_row(4, total_hip=12)],
+    })
+    daylog = DayLog.create_empty(7, DAY)
+    daylog.total_hip = 12
+
+    result = await client.async_upsert_daylog(daylog)
+
+    assert _ops(fake) == [("day_logs", "upsert"), ("day_logs", "select"), ("day_logs", "update")]
+    assert daylog.id == 4
+    assert result.id == 4
+    assert result.total_hip == 12
+
+
+@pytest.mark.asyncio
+async def test_upsert_daylog_without_client_returns_input():
+    """클라이언트 초기화 전에는 요청 없이 입력 DayLog를 그대로 반환"""
+    client = SupabaseClient("https://example.supabase.co", "key")
+    daylog = DayLog.create_empty(7, DAY)
+
+    assert await client.async_upsert_daylog(daylog) is daylog